@@ -0,0 +1,15 @@
+"""Helpers shared by the specialist agents"""
+from functools import lru_cache
+
+from langchain_core.messages import SystemMessage
+
+
+@lru_cache(maxsize=32)
+def _sys(prompt: str) -> SystemMessage:
+    """
+    Return a shared SystemMessage for a prompt string.
+
+    Agent prompts are module constants, so one message instance per prompt is
+    built once and reused instead of constructing a new one on every call.
+    """
+    return SystemMessage(content=prompt)
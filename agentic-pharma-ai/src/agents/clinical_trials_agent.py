@@ -1,55 +1,81 @@
-from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from services.llm_service import llm
 from graph.state import State
+from agents._common import _sys
 from prompts.system_prompts import CLINICAL_TRIALS_PROMPT
-from tools.clinical_trials_data import get_clinical_trial_data, format_trial_for_llm
+from tools.prefetch import fetch_formatted
 
 
-def clinical_trials_agent(state: State) -> dict:
-    """
-    Clinical Trials Specialist Agent
-    Analyzes clinical trial data, study designs, and patient outcomes
-    Uses clinical trials data tool to fetch real data
-    """
-    system_prompt = state.get("clinical_trials_prompt", CLINICAL_TRIALS_PROMPT)
+# Data-context template, built once at import
+_CONTEXT_TMPL = """
+Based on the following clinical trial data from our database:
+
+{body}
+
+Please provide your expert analysis and insights.
+"""
+_NO_DATA = "No clinical trial data found for the query."
+
+
+def _build_messages(state: State) -> list:
+    """Build the LLM message chain for this agent"""
     messages = state.get("message", [])
     
     # Get the last user message to extract query
     last_message = messages[-1]
     query = last_message.content
     
-    # Fetch clinical trial data using the data tool
-    trial_data = get_clinical_trial_data(query)
-    
-    # Format trial data for LLM
-    formatted_data = ""
-    if trial_data.get("found"):
-        trials = trial_data.get("trials", [])
-        for trial in trials:
-            formatted_data += format_trial_for_llm(trial) + "\n"
+    # Use the orchestrator's prefetched data, else run the data tool now
+    formatted_data = state.get("prefetch", {}).get("clinical_trials")
+    if formatted_data is None:
+        formatted_data = fetch_formatted("clinical_trials", query)
     
     # Create context message with fetched data
-    data_context = f"""
-Based on the following clinical trial data from our database:
-
-{formatted_data if formatted_data else "No clinical trial data found for the query."}
-
-Please provide your expert analysis and insights.
-"""
+    data_context = _CONTEXT_TMPL.format(body=formatted_data or _NO_DATA)
     
     # Build message chain with system prompt and data context
     full_messages = [
-        SystemMessage(content=system_prompt),
+        _sys(CLINICAL_TRIALS_PROMPT),
         HumanMessage(content=data_context),
         *messages
     ]
     
+    return full_messages
+
+
+def clinical_trials_agent(state: State) -> dict:
+    """
+    Clinical Trials Specialist Agent
+    Analyzes clinical trial data, study designs, and patient outcomes
+    Uses clinical trials data tool to fetch real data
+    """
+    full_messages = _build_messages(state)
+    
     # Invoke LLM
     response = llm.invoke(full_messages)
     
-    # Update state with agent response
-    updated_messages = messages + [response]
+    # Return only the new message; the scheduler appends it to the state
+    return {
+        "message": [response]
+    }
+
+
+async def aclinical_trials_agent(state: State) -> dict:
+    """Async variant of `clinical_trials_agent` that awaits `llm.ainvoke`"""
+    full_messages = _build_messages(state)
+    
+    # Invoke LLM without blocking the event loop
+    response = await llm.ainvoke(full_messages)
     
+    # Return only the new message; the scheduler appends it to the state
     return {
-        "message": updated_messages
-    }
\ No newline at end of file
+        "message": [response]
+    }
+
+
+async def astream_clinical_trials_agent(state: State):
+    """Streaming variant of `clinical_trials_agent` that yields response chunks from `llm.astream`"""
+    full_messages = _build_messages(state)
+    
+    async for chunk in llm.astream(full_messages):
+        yield chunk
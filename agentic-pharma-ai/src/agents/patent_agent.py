@@ -1,55 +1,81 @@
-from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from services.llm_service import llm
 from graph.state import State
+from agents._common import _sys
 from prompts.system_prompts import PATENT_PROMPT
-from tools.patent_data import get_patent_data, format_patent_for_llm
+from tools.prefetch import fetch_formatted
 
 
-def patent_agent(state: State) -> dict:
-    """
-    Patent Expert Agent
-    Analyzes patent information, intellectual property, and drug formulations
-    Uses patent data tool to fetch real data
-    """
-    system_prompt = state.get("patent_prompt", PATENT_PROMPT)
+# Data-context template, built once at import
+_CONTEXT_TMPL = """
+Based on the following patent data from our database:
+
+{body}
+
+Please provide your expert analysis and insights on IP protection, freedom to operate, and patent landscape.
+"""
+_NO_DATA = "No patent data found for the query."
+
+
+def _build_messages(state: State) -> list:
+    """Build the LLM message chain for this agent"""
     messages = state.get("message", [])
     
     # Get the last user message to extract query
     last_message = messages[-1]
     query = last_message.content
     
-    # Fetch patent data using the data tool
-    patent_data = get_patent_data(query)
-    
-    # Format patent data for LLM
-    formatted_data = ""
-    if patent_data.get("found"):
-        patents = patent_data.get("patents", [])
-        for patent in patents:
-            formatted_data += format_patent_for_llm(patent) + "\n"
+    # Use the orchestrator's prefetched data, else run the data tool now
+    formatted_data = state.get("prefetch", {}).get("patent")
+    if formatted_data is None:
+        formatted_data = fetch_formatted("patent", query)
     
     # Create context message with fetched data
-    data_context = f"""
-Based on the following patent data from our database:
-
-{formatted_data if formatted_data else "No patent data found for the query."}
-
-Please provide your expert analysis and insights on IP protection, freedom to operate, and patent landscape.
-"""
+    data_context = _CONTEXT_TMPL.format(body=formatted_data or _NO_DATA)
     
     # Build message chain with system prompt and data context
     full_messages = [
-        SystemMessage(content=system_prompt),
+        _sys(PATENT_PROMPT),
         HumanMessage(content=data_context),
         *messages
     ]
     
+    return full_messages
+
+
+def patent_agent(state: State) -> dict:
+    """
+    Patent Expert Agent
+    Analyzes patent information, intellectual property, and drug formulations
+    Uses patent data tool to fetch real data
+    """
+    full_messages = _build_messages(state)
+    
     # Invoke LLM
     response = llm.invoke(full_messages)
     
-    # Update state with agent response
-    updated_messages = messages + [response]
+    # Return only the new message; the scheduler appends it to the state
+    return {
+        "message": [response]
+    }
+
+
+async def apatent_agent(state: State) -> dict:
+    """Async variant of `patent_agent` that awaits `llm.ainvoke`"""
+    full_messages = _build_messages(state)
     
+    # Invoke LLM without blocking the event loop
+    response = await llm.ainvoke(full_messages)
+    
+    # Return only the new message; the scheduler appends it to the state
     return {
-        "message": updated_messages
+        "message": [response]
     }
+
+
+async def astream_patent_agent(state: State):
+    """Streaming variant of `patent_agent` that yields response chunks from `llm.astream`"""
+    full_messages = _build_messages(state)
+    
+    async for chunk in llm.astream(full_messages):
+        yield chunk
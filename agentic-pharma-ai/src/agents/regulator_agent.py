@@ -1,55 +1,81 @@
-from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from services.llm_service import llm
 from graph.state import State
+from agents._common import _sys
 from prompts.system_prompts import REGULATORY_PROMPT
-from tools.regulatory_data import get_regulatory_data, format_regulatory_for_llm
+from tools.prefetch import fetch_formatted
 
 
-def regulatory_agent(state: State) -> dict:
-    """
-    Regulatory Compliance Expert Agent
-    Analyzes FDA approval pathways, drug safety, and compliance requirements
-    Uses regulatory data tool to fetch real data
-    """
-    system_prompt = state.get("regulator_prompt", REGULATORY_PROMPT)
+# Data-context template, built once at import
+_CONTEXT_TMPL = """
+Based on the following regulatory data from our database:
+
+{body}
+
+Please provide your expert analysis and insights on FDA approval status, compliance requirements, and safety considerations.
+"""
+_NO_DATA = "No regulatory data found for the query."
+
+
+def _build_messages(state: State) -> list:
+    """Build the LLM message chain for this agent"""
     messages = state.get("message", [])
     
     # Get the last user message to extract query
     last_message = messages[-1]
     query = last_message.content
     
-    # Fetch regulatory data using the data tool
-    reg_data = get_regulatory_data(query)
-    
-    # Format regulatory data for LLM
-    formatted_data = ""
-    if reg_data.get("found"):
-        applications = reg_data.get("applications", [])
-        for app in applications:
-            formatted_data += format_regulatory_for_llm(app) + "\n"
+    # Use the orchestrator's prefetched data, else run the data tool now
+    formatted_data = state.get("prefetch", {}).get("regulatory")
+    if formatted_data is None:
+        formatted_data = fetch_formatted("regulatory", query)
     
     # Create context message with fetched data
-    data_context = f"""
-Based on the following regulatory data from our database:
-
-{formatted_data if formatted_data else "No regulatory data found for the query."}
-
-Please provide your expert analysis and insights on FDA approval status, compliance requirements, and safety considerations.
-"""
+    data_context = _CONTEXT_TMPL.format(body=formatted_data or _NO_DATA)
     
     # Build message chain with system prompt and data context
     full_messages = [
-        SystemMessage(content=system_prompt),
+        _sys(REGULATORY_PROMPT),
         HumanMessage(content=data_context),
         *messages
     ]
     
+    return full_messages
+
+
+def regulatory_agent(state: State) -> dict:
+    """
+    Regulatory Compliance Expert Agent
+    Analyzes FDA approval pathways, drug safety, and compliance requirements
+    Uses regulatory data tool to fetch real data
+    """
+    full_messages = _build_messages(state)
+    
     # Invoke LLM
     response = llm.invoke(full_messages)
     
-    # Update state with agent response
-    updated_messages = messages + [response]
+    # Return only the new message; the scheduler appends it to the state
+    return {
+        "message": [response]
+    }
+
+
+async def aregulatory_agent(state: State) -> dict:
+    """Async variant of `regulatory_agent` that awaits `llm.ainvoke`"""
+    full_messages = _build_messages(state)
     
+    # Invoke LLM without blocking the event loop
+    response = await llm.ainvoke(full_messages)
+    
+    # Return only the new message; the scheduler appends it to the state
     return {
-        "message": updated_messages
+        "message": [response]
     }
+
+
+async def astream_regulatory_agent(state: State):
+    """Streaming variant of `regulatory_agent` that yields response chunks from `llm.astream`"""
+    full_messages = _build_messages(state)
+    
+    async for chunk in llm.astream(full_messages):
+        yield chunk
@@ -1,55 +1,81 @@
-from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from services.llm_service import llm
 from graph.state import State
+from agents._common import _sys
 from prompts.system_prompts import SCIENTIFIC_JOURNAL_PROMPT
-from tools.scientific_journal_data import get_journal_data, format_article_for_llm
+from tools.prefetch import fetch_formatted
 
 
-def scientific_journal_agent(state: State) -> dict:
-    """
-    Scientific Literature Research Specialist Agent
-    Analyzes published peer-reviewed research and scientific literature
-    Uses scientific journal data tool to fetch real data
-    """
-    system_prompt = state.get("scientific_journal_prompt", SCIENTIFIC_JOURNAL_PROMPT)
+# Data-context template, built once at import
+_CONTEXT_TMPL = """
+Based on the following scientific literature data from our database:
+
+{body}
+
+Please provide your expert analysis and insights on published research, study quality, and scientific evidence.
+"""
+_NO_DATA = "No scientific literature found for the query."
+
+
+def _build_messages(state: State) -> list:
+    """Build the LLM message chain for this agent"""
     messages = state.get("message", [])
     
     # Get the last user message to extract query
     last_message = messages[-1]
     query = last_message.content
     
-    # Fetch journal data using the data tool
-    journal_data = get_journal_data(query)
-    
-    # Format journal data for LLM
-    formatted_data = ""
-    if journal_data.get("found"):
-        articles = journal_data.get("articles", [])
-        for article in articles:
-            formatted_data += format_article_for_llm(article) + "\n"
+    # Use the orchestrator's prefetched data, else run the data tool now
+    formatted_data = state.get("prefetch", {}).get("scientific_journal")
+    if formatted_data is None:
+        formatted_data = fetch_formatted("scientific_journal", query)
     
     # Create context message with fetched data
-    data_context = f"""
-Based on the following scientific literature data from our database:
-
-{formatted_data if formatted_data else "No scientific literature found for the query."}
-
-Please provide your expert analysis and insights on published research, study quality, and scientific evidence.
-"""
+    data_context = _CONTEXT_TMPL.format(body=formatted_data or _NO_DATA)
     
     # Build message chain with system prompt and data context
     full_messages = [
-        SystemMessage(content=system_prompt),
+        _sys(SCIENTIFIC_JOURNAL_PROMPT),
         HumanMessage(content=data_context),
         *messages
     ]
     
+    return full_messages
+
+
+def scientific_journal_agent(state: State) -> dict:
+    """
+    Scientific Literature Research Specialist Agent
+    Analyzes published peer-reviewed research and scientific literature
+    Uses scientific journal data tool to fetch real data
+    """
+    full_messages = _build_messages(state)
+    
     # Invoke LLM
     response = llm.invoke(full_messages)
     
-    # Update state with agent response
-    updated_messages = messages + [response]
+    # Return only the new message; the scheduler appends it to the state
+    return {
+        "message": [response]
+    }
+
+
+async def ascientific_journal_agent(state: State) -> dict:
+    """Async variant of `scientific_journal_agent` that awaits `llm.ainvoke`"""
+    full_messages = _build_messages(state)
     
+    # Invoke LLM without blocking the event loop
+    response = await llm.ainvoke(full_messages)
+    
+    # Return only the new message; the scheduler appends it to the state
     return {
-        "message": updated_messages
+        "message": [response]
     }
+
+
+async def astream_scientific_journal_agent(state: State):
+    """Streaming variant of `scientific_journal_agent` that yields response chunks from `llm.astream`"""
+    full_messages = _build_messages(state)
+    
+    async for chunk in llm.astream(full_messages):
+        yield chunk
@@ -1,7 +1,8 @@
-from langchain_core.messages import SystemMessage, AIMessage
+from langchain_core.messages import AIMessage
 from services.llm_service import llm
 from graph.state import State
-from prompts.system_prompts import SUMMARIZER_PROMPT
+from agents._common import _sys
+from prompts.system_prompts import ORCHESTRATOR_PROMPT
 
 
 def summarizer_agent(state: State) -> dict:
@@ -9,18 +10,42 @@ def summarizer_agent(state: State) -> dict:
     Summarizer Agent
     Synthesizes findings from multiple specialized agents into coherent reports
     """
-    system_prompt = state.get("system_prompt", SUMMARIZER_PROMPT)
     messages = state.get("message", [])
     
-    # Build message chain with system prompt
-    full_messages = [SystemMessage(content=system_prompt)] + messages
+    # Build message chain with the orchestrator prompt, which the summarizer
+    # has always synthesized under (formerly read from state["system_prompt"])
+    full_messages = [_sys(ORCHESTRATOR_PROMPT)] + messages
     
     # Invoke LLM for final synthesis
     response = llm.invoke(full_messages)
     
-    # Update state with summary response
-    updated_messages = messages + [response]
+    # Return only the new message; the scheduler appends it to the state
+    return {
+        "message": [response]
+    }
+
+
+async def asummarizer_agent(state: State) -> dict:
+    """Async variant of `summarizer_agent` that awaits `llm.ainvoke`"""
+    messages = state.get("message", [])
+    
+    # Build message chain with the orchestrator prompt
+    full_messages = [_sys(ORCHESTRATOR_PROMPT)] + messages
     
+    # Invoke LLM for final synthesis without blocking the event loop
+    response = await llm.ainvoke(full_messages)
+    
+    # Return only the new message; the scheduler appends it to the state
     return {
-        "message": updated_messages
+        "message": [response]
     }
+
+
+async def astream_summarizer_agent(state: State):
+    """Streaming variant of `summarizer_agent` that yields response chunks from `llm.astream`"""
+    messages = state.get("message", [])
+    
+    full_messages = [_sys(ORCHESTRATOR_PROMPT)] + messages
+    
+    async for chunk in llm.astream(full_messages):
+        yield chunk
@@ -3,16 +3,20 @@ Pharmaceutical Research Orchestrator - FastAPI Application
 Exposes the multi-agent orchestrator as REST API endpoints
 """
 
-from fastapi import FastAPI, HTTPException, Query 
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import asyncio
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from typing import List, Dict, Any
+from anyio import CapacityLimiter, to_thread
+from langchain_core.messages import AIMessage
 
 # Import orchestrator
-from orchestrator import run_orchestrator, format_response, initialize_state
-from graph.state import State
+from orchestrator import run_orchestrator_async, stream_orchestrator, format_response
+from services.llm_service import response_cache, http_async_client, LLM_TIMEOUT_SEC
 
 # Import data tools
 from tools.clinical_trials_data import get_clinical_trial_data, get_all_clinical_trials
@@ -23,6 +27,7 @@ from tools.scientific_journal_data import get_journal_data, get_all_articles
 # Import API models
 from models.api_models import (
     QueryRequest,
+    BatchQueryRequest,
     OrchestratorResponse,
     HealthResponse,
     ErrorResponse,
@@ -42,7 +47,8 @@ app = FastAPI(
     description="Multi-agent AI system for pharmaceutical research analysis",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -54,6 +60,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Upper bound on orchestrator queries in flight; each one fans out to several
+# LLM calls, so this keeps bursts within the provider's rate limits
+QUERY_SEM = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_QUERIES", "8")))
+
+# Upper bound on worker threads used for blocking data-tool lookups
+TOOL_THREAD_LIMIT = int(os.getenv("TOOL_THREAD_LIMIT", "16"))
+_tool_limiter = None
+
+
+async def run_tool(fn, *args):
+    """
+    Run a blocking data-tool lookup in a worker thread
+    
+    Keeps the event loop free while the lookup runs; the shared
+    CapacityLimiter stops bursts of requests from growing the thread pool
+    without bound.
+    """
+    global _tool_limiter
+    if _tool_limiter is None:
+        _tool_limiter = CapacityLimiter(TOOL_THREAD_LIMIT)
+    return await to_thread.run_sync(fn, *args, limiter=_tool_limiter)
+
 
 # ============================================================================
 # HEALTH & INFO ENDPOINTS
@@ -106,10 +134,12 @@ async def get_info():
         ],
         "endpoints": {
             "query": "/query",
+            "query_stream": "/query/stream",
             "query_clinical": "/data/clinical-trials",
             "query_patents": "/data/patents",
             "query_regulatory": "/data/regulatory",
-            "query_journal": "/data/journal"
+            "query_journal": "/data/journal",
+            "query_batch": "/data/batch"
         }
     }
 
@@ -136,7 +166,9 @@ async def query_orchestrator(request: QueryRequest):
         OrchestratorResponse: Final analysis with agent responses
         
     Raises:
-        HTTPException: If query is invalid or processing fails
+        HTTPException: 504 if the agents exceed LLM_TIMEOUT_SEC, 500 if
+            processing fails (invalid queries are rejected with 422 by
+            QueryRequest validation)
         
     Example:
         POST /query
@@ -146,51 +178,112 @@ async def query_orchestrator(request: QueryRequest):
         }
     """
     try:
-        # Validate query
-        if not request.query or len(request.query.strip()) < 3:
-            raise HTTPException(
-                status_code=400,
-                detail="Query must be at least 3 characters long"
-            )
+        logger.info("Processing query: %s", request.query)
+        # Request timestamp in UTC, like the error handlers
+        received_at = datetime.now(timezone.utc)
         
-        logger.info(f"Processing query: {request.query}")
-        
-        # Run orchestrator
-        final_state = run_orchestrator(request.query)
+        # Run orchestrator (specialist agents are dispatched concurrently)
+        async with QUERY_SEM:
+            final_state = await asyncio.wait_for(run_orchestrator_async(request.query), LLM_TIMEOUT_SEC)
         
         # Get final response
         final_response = format_response(final_state)
         
         # Determine which agents were consulted
         messages = final_state.get("message", [])
-        ai_messages = [m for m in messages if hasattr(m, '__class__') and 'AIMessage' in m.__class__.__name__]
-        agent_count = len(ai_messages)
+        agent_count = sum(1 for m in messages if isinstance(m, AIMessage))
         
-        # Determine if synthesis was performed
-        synthesis_performed = agent_count > 1
+        # Determine if synthesis was performed (a failed summarizer adds
+        # no message, so the scheduler records it rather than a count)
+        synthesis_performed = final_state.get("synthesized", False)
         
-        logger.info(f"Query processed successfully. Agents consulted: {agent_count}")
+        logger.info("Query processed successfully. Agents consulted: %s", agent_count)
         
-        return OrchestratorResponse(
+        response = OrchestratorResponse(
             query=request.query,
             final_response=final_response,
             agents_consulted=[f"agent_{i}" for i in range(agent_count)],
             agent_count=agent_count,
             total_messages=len(messages),
             synthesis_performed=synthesis_performed,
-            timestamp=datetime.now()
+            timestamp=received_at
+        )
+        
+        # Serialize through the model; returning a Response skips FastAPI's
+        # dump-and-revalidate pass over response_model
+        return Response(
+            content=response.model_dump_json(),
+            media_type="application/json"
         )
         
     except HTTPException:
         raise
+    except asyncio.TimeoutError:
+        logger.error("Query timed out after %ss: %s", LLM_TIMEOUT_SEC, request.query)
+        raise HTTPException(status_code=504, detail="LLM timeout")
     except Exception as e:
-        logger.error(f"Error processing query: {str(e)}")
+        logger.error("Error processing query: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing query: {str(e)}"
         )
 
 
+def _sse(event: str, data: str) -> str:
+    """Format one Server-Sent Event; multi-line data becomes multiple data: lines"""
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {event}\n{lines}\n"
+
+
+@app.get("/query/stream", tags=["Orchestrator"])
+async def query_stream(q: str = Query(..., min_length=3, description="The pharmaceutical research question")):
+    """
+    Stream the orchestrator's response as Server-Sent Events
+    
+    Each chunk is sent as it is generated, with the SSE event name set to
+    the agent that produced it (`clinical_trials`, `patent`, `regulatory`,
+    `scientific_journal`, then `summarizer`). A final `done` event closes
+    the stream. The whole stream is bounded by LLM_TIMEOUT_SEC like /query;
+    past it an `error` event reports the timeout.
+    
+    Args:
+        q: The pharmaceutical research question
+        
+    Returns:
+        StreamingResponse: text/event-stream of agent output
+        
+    Example:
+        GET /query/stream?q=clinical trials for DTZ-100
+    """
+    logger.info("Streaming query: %s", q)
+    
+    async def event_stream():
+        try:
+            async with QUERY_SEM:
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + LLM_TIMEOUT_SEC
+                chunks = stream_orchestrator(q)
+                try:
+                    while True:
+                        try:
+                            event, text = await asyncio.wait_for(anext(chunks), deadline - loop.time())
+                        except StopAsyncIteration:
+                            break
+                        if text:
+                            yield _sse(event, text)
+                finally:
+                    await chunks.aclose()
+        except asyncio.TimeoutError:
+            logger.error("Stream timed out after %ss: %s", LLM_TIMEOUT_SEC, q)
+            yield _sse("error", "LLM timeout")
+        except Exception as e:
+            logger.error("Error streaming query: %s", e)
+            yield _sse("error", str(e))
+        yield _sse("done", "[DONE]")
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 # ============================================================================
 # DATA TOOL ENDPOINTS - Clinical Trials
 # ============================================================================
@@ -210,9 +303,9 @@ async def get_clinical_trials(query: str = Query(..., description="Search query
         GET /data/clinical-trials?query=cancer
     """
     try:
-        logger.info(f"Clinical trials search: {query}")
+        logger.info("Clinical trials search: %s", query)
         
-        result = get_clinical_trial_data(query)
+        result = await run_tool(get_clinical_trial_data, query)
         
         return DataToolResponse(
             tool_name="clinical_trials",
@@ -222,7 +315,7 @@ async def get_clinical_trials(query: str = Query(..., description="Search query
         )
         
     except Exception as e:
-        logger.error(f"Error searching clinical trials: {str(e)}")
+        logger.error("Error searching clinical trials: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error searching clinical trials: {str(e)}"
@@ -240,7 +333,7 @@ async def get_all_trials():
     try:
         logger.info("Fetching all clinical trials")
         
-        result = get_all_clinical_trials()
+        result = await run_tool(get_all_clinical_trials)
         
         return DataToolResponse(
             tool_name="clinical_trials",
@@ -250,7 +343,7 @@ async def get_all_trials():
         )
         
     except Exception as e:
-        logger.error(f"Error fetching clinical trials: {str(e)}")
+        logger.error("Error fetching clinical trials: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching clinical trials: {str(e)}"
@@ -276,9 +369,9 @@ async def get_patents(query: str = Query(..., description="Search query for pate
         GET /data/patents?query=US10234567
     """
     try:
-        logger.info(f"Patent search: {query}")
+        logger.info("Patent search: %s", query)
         
-        result = get_patent_data(query)
+        result = await run_tool(get_patent_data, query)
         
         return DataToolResponse(
             tool_name="patent",
@@ -288,7 +381,7 @@ async def get_patents(query: str = Query(..., description="Search query for pate
         )
         
     except Exception as e:
-        logger.error(f"Error searching patents: {str(e)}")
+        logger.error("Error searching patents: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error searching patents: {str(e)}"
@@ -306,7 +399,7 @@ async def get_active_patents_endpoint():
     try:
         logger.info("Fetching active patents")
         
-        result = get_active_patents()
+        result = await run_tool(get_active_patents)
         
         return DataToolResponse(
             tool_name="patent",
@@ -316,7 +409,7 @@ async def get_active_patents_endpoint():
         )
         
     except Exception as e:
-        logger.error(f"Error fetching active patents: {str(e)}")
+        logger.error("Error fetching active patents: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching active patents: {str(e)}"
@@ -342,9 +435,9 @@ async def get_regulatory(query: str = Query(..., description="Search query for r
         GET /data/regulatory?query=DTZ-100
     """
     try:
-        logger.info(f"Regulatory search: {query}")
+        logger.info("Regulatory search: %s", query)
         
-        result = get_regulatory_data(query)
+        result = await run_tool(get_regulatory_data, query)
         
         return DataToolResponse(
             tool_name="regulatory",
@@ -354,7 +447,7 @@ async def get_regulatory(query: str = Query(..., description="Search query for r
         )
         
     except Exception as e:
-        logger.error(f"Error searching regulatory data: {str(e)}")
+        logger.error("Error searching regulatory data: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error searching regulatory data: {str(e)}"
@@ -372,7 +465,7 @@ async def get_approved_drugs_endpoint():
     try:
         logger.info("Fetching approved drugs")
         
-        result = get_approved_drugs()
+        result = await run_tool(get_approved_drugs)
         
         return DataToolResponse(
             tool_name="regulatory",
@@ -382,7 +475,7 @@ async def get_approved_drugs_endpoint():
         )
         
     except Exception as e:
-        logger.error(f"Error fetching approved drugs: {str(e)}")
+        logger.error("Error fetching approved drugs: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching approved drugs: {str(e)}"
@@ -408,9 +501,9 @@ async def get_journal(query: str = Query(..., description="Search query for jour
         GET /data/journal?query=cancer
     """
     try:
-        logger.info(f"Journal search: {query}")
+        logger.info("Journal search: %s", query)
         
-        result = get_journal_data(query)
+        result = await run_tool(get_journal_data, query)
         
         return DataToolResponse(
             tool_name="scientific_journal",
@@ -420,7 +513,7 @@ async def get_journal(query: str = Query(..., description="Search query for jour
         )
         
     except Exception as e:
-        logger.error(f"Error searching journal: {str(e)}")
+        logger.error("Error searching journal: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error searching journal: {str(e)}"
@@ -438,7 +531,7 @@ async def get_all_journal_articles():
     try:
         logger.info("Fetching all journal articles")
         
-        result = get_all_articles()
+        result = await run_tool(get_all_articles)
         
         return DataToolResponse(
             tool_name="scientific_journal",
@@ -448,13 +541,87 @@ async def get_all_journal_articles():
         )
         
     except Exception as e:
-        logger.error(f"Error fetching journal articles: {str(e)}")
+        logger.error("Error fetching journal articles: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching journal articles: {str(e)}"
         )
 
 
+# ============================================================================
+# DATA TOOL ENDPOINTS - Batch
+# ============================================================================
+
+@app.post("/data/batch", response_model=Dict[str, DataToolResponse], tags=["Data Tools"])
+async def data_batch(request: BatchQueryRequest):
+    """
+    Search all four data tools with one request
+    
+    The clinical trials, patent, regulatory and journal lookups run
+    concurrently, saving clients three round-trips.
+    
+    Args:
+        request (BatchQueryRequest): Query sent to every data tool
+        
+    Returns:
+        Dictionary of DataToolResponse keyed by tool name
+        
+    Example:
+        POST /data/batch
+        {
+            "query": "DTZ-100"
+        }
+    """
+    try:
+        logger.info("Batch data search: %s", request.query)
+        
+        query = request.query
+        trials, patents, applications, articles = await asyncio.gather(
+            run_tool(get_clinical_trial_data, query),
+            run_tool(get_patent_data, query),
+            run_tool(get_regulatory_data, query),
+            run_tool(get_journal_data, query)
+        )
+        
+        results = {}
+        for tool_name, result, key in (
+            ("clinical_trials", trials, "trials"),
+            ("patent", patents, "patents"),
+            ("regulatory", applications, "applications"),
+            ("scientific_journal", articles, "articles")
+        ):
+            results[tool_name] = DataToolResponse(
+                tool_name=tool_name,
+                found=result.get("found", False),
+                count=len(result.get(key, [])),
+                data=result.get(key, [])
+            )
+        
+        return results
+        
+    except Exception as e:
+        logger.error("Error in batch data search: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error in batch data search: {str(e)}"
+        )
+
+
+# ============================================================================
+# CACHE ENDPOINTS
+# ============================================================================
+
+@app.get("/cache/stats", tags=["Cache"])
+async def get_cache_stats():
+    """
+    Get LLM response cache statistics
+
+    Returns:
+        Dictionary with cache hits, misses, hit rate and size
+    """
+    return response_cache.stats()
+
+
 # ============================================================================
 # ROOT ENDPOINT
 # ============================================================================
@@ -475,7 +642,9 @@ async def root():
             "clinical_trials": "/data/clinical-trials",
             "patents": "/data/patents",
             "regulatory": "/data/regulatory",
-            "journal": "/data/journal"
+            "journal": "/data/journal",
+            "batch": "/data/batch",
+            "cache_stats": "/cache/stats"
         }
     }
 
@@ -487,12 +656,12 @@ async def root():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions"""
-    logger.error(f"HTTP Exception: {exc.detail}")
-    return JSONResponse(
+    logger.error("HTTP Exception: %s", exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         },
     )
 
@@ -500,13 +669,13 @@ async def http_exception_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle general exceptions"""
-    logger.error(f"Unhandled Exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled Exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
             "detail": str(exc),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         },
     )
 
@@ -524,8 +693,9 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log application shutdown"""
+    """Log application shutdown and close the shared LLM HTTP client"""
     logger.info("Application shutting down")
+    await http_async_client.aclose()
 
 
 if __name__ == "__main__":
@@ -537,5 +707,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # "auto" selects uvloop (see requirements-api.txt) when it is installed;
+        # it runs asyncio.gather and thread-pool offloads faster than the
+        # stdlib selector loop, falling back to asyncio on Windows
+        loop="auto"
     )
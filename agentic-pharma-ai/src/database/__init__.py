@@ -1,14 +1,476 @@
 """Mock Data Sources - Simulating Real Databases"""
 import json
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 from typing import Dict, List
-from datetime import datetime, timedelta
+from datetime import date, datetime
 import random
+import sys
+import time
+
+import numpy as np
+import orjson
+
+
+# Shared generator; each search_* draws its values in a few vectorized calls
+# instead of one `random` call per field
+_RNG = np.random.default_rng()
+
+
+def _uniform_layout(**groups):
+    """
+    Flatten named (low, high, size[, decimals[, scale]]) groups into flat
+    arrays so a function can draw all of its floats with a single call.
+    low/high may be scalars or per-element sequences of length size.
+    decimals (scalar or per-element, None = unrounded) rounds the group in
+    the same vector pass instead of a round() per output field; scale names
+    an earlier group whose first (unrounded) value multiplies this one first.
+    """
+    lows, spans, mults, scales, slices, start = [], [], [], [], {}, 0
+    for name, (low, high, size, *extra) in groups.items():
+        decimals, scale = (*extra, None, None)[:2]
+        low = np.broadcast_to(np.asarray(low, dtype=float), (size,))
+        high = np.broadcast_to(np.asarray(high, dtype=float), (size,))
+        lows.append(low)
+        spans.append(high - low)
+        decimals = decimals if isinstance(decimals, tuple) else (decimals,) * size
+        mults.append([np.nan if d is None else 10.0 ** d for d in decimals])
+        scales.append([-1 if scale is None else slices[scale].start] * size)
+        slices[name] = slice(start, start + size)
+        start += size
+    mult, scale_idx = np.concatenate(mults), np.concatenate(scales)
+    rounded, scaled = ~np.isnan(mult), scale_idx >= 0
+    rounding = (mult, rounded) if rounded.any() else None
+    scaling = (np.where(scaled, scale_idx, 0), scaled) if scaled.any() else None
+    return np.concatenate(lows), np.concatenate(spans), slices, rounding, scaling
+
+
+def _draw_uniform(layout) -> Dict[str, List[float]]:
+    """
+    Draw every group of a `_uniform_layout` at once; returns name -> floats.
+    The fixed cost is a few microseconds of NumPy calls, so it only pays off
+    from roughly ten values per call; a couple of scalar draws are cheaper
+    as round(random.uniform(...)).
+    """
+    low, span, slices, rounding, scaling = layout
+    vals = low + span * _RNG.random(len(low))
+    if scaling is not None:
+        idx, mask = scaling
+        vals = np.where(mask, vals * vals[idx], vals)
+    if rounding is not None:
+        mult, mask = rounding
+        vals = np.where(mask, np.round(vals * mult) / mult, vals)
+    vals = vals.tolist()
+    return {name: vals[s] for name, s in slices.items()}
+
+
+def _draw_ints(n: int) -> List[int]:
+    """n raw 64-bit draws; callers reduce them with % / & for small picks"""
+    return _RNG.bit_generator.random_raw(n).tolist()
+
+
+# Today's date ordinal, read from the clock at most once per _TODAY_TTL
+# seconds and shared by every search_* call (dates may lag by up to that
+# long after midnight, which is fine for mock data)
+_TODAY_TTL = 3600.0
+_today = (0.0, 0)  # (monotonic refresh deadline, ordinal)
+
+
+def _today_ordinal() -> int:
+    """Return today's proleptic Gregorian ordinal, refreshed lazily"""
+    global _today
+    deadline, ordinal = _today
+    now = time.monotonic()
+    if now >= deadline:
+        ordinal = datetime.now().toordinal()
+        _today = (now + _TODAY_TTL, ordinal)
+    return ordinal
+
+
+@lru_cache(maxsize=8192)
+def _fmt_ordinal(ordinal: int) -> str:
+    """
+    Format a proleptic Gregorian ordinal as YYYY-MM-DD. Mock dates are always
+    today +/- whole days or years, so the cache serves nearly every call.
+    """
+    d = date.fromordinal(ordinal)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _sample_k(population, k: int) -> list:
+    """
+    Pick k distinct items with a partial Fisher-Yates shuffle: the k swap
+    positions come from one vectorized draw, leaving k swaps in Python
+    (random.sample does a rejection loop with a set per call).
+    """
+    n = len(population)
+    idx = list(range(n))
+    for i, u in enumerate(_RNG.random(k).tolist()):
+        j = i + int(u * (n - i))
+        idx[i], idx[j] = idx[j], idx[i]
+    return [population[j] for j in idx[:k]]
+
+
+# Regions in regional_breakdown order, with the (low, high) percent of the
+# market each one holds; revenue share draws the same range as a fraction
+_REGIONS = ("North America", "Europe", "Asia-Pacific", "Latin America", "Middle East & Africa")
+_REGION_PCT_RANGES = np.array([[35, 55], [25, 40], [10, 30], [3, 10], [2, 8]])
+
+# Groups are emitted already rounded; *_revenue and region_share are
+# fractions of the base revenue (scale="base")
+_IQVIA_UNIFORM = _uniform_layout(
+    base=((300, 3, 800, 0.80), (2500, 18, 3500, 0.99), 4, (None, None, 0, 2)),  # revenue, cagr, hhi, confidence
+    region_pct=(_REGION_PCT_RANGES[:, 0], _REGION_PCT_RANGES[:, 1], 5, 1),
+    region_share=(_REGION_PCT_RANGES[:, 0] / 100, _REGION_PCT_RANGES[:, 1] / 100, 5, 2, "base"),
+    region_growth=(-2, 22, 5, 2),
+    # top-3 competitors draw their share from 2-25%, the rest from 1-8%
+    share=(np.where(np.arange(10) < 3, 2, 1), np.where(np.arange(10) < 3, 25, 8), 10, 2),
+    comp_revenue=(0.02, 0.25, 10, 2, "base"),
+    comp_yoy=(-5, 20, 10, 2),
+    form_revenue=((0.50, 0.15, 0.05, 0.02), (0.70, 0.35, 0.20, 0.10), 4, 2, "base"),  # oral, injectable, topical, other
+    form_pct=((50, 15, 5, 2), (70, 35, 20, 10), 4, 1),
+    form_volume=((500000, 100000, 50000, 10000), (5000000, 800000, 300000, 100000), 4, 0),
+    hist_volume=(1000000, 10000000, 5, 0),
+    hist_top3=(35, 65, 5, 1),
+    dose_revenue=(0.10, 0.30, 4, 2, "base"),
+    dose_pct=(10, 30, 4, 1),
+    dose_volume=(100000, 500000, 4, 0),
+)
+
+
+def _interned(*strings: str) -> tuple:
+    """Tuple of interned strings, for categorical values picked by index"""
+    return tuple(sys.intern(s) for s in strings)
+
+
+# Segment keys of the iqvia breakdowns, shared by every result (the
+# strength keys used to be a fresh f-string per call)
+_FORMULATIONS = _interned("oral", "injectable", "topical", "other")
+_DOSE_STRENGTHS = _interned(*(f"Strength {j}" for j in range(1, 5)))
+
+_TRIAL_PHASES = _interned("Phase 1", "Phase 2", "Phase 3", "Phase 4")
+_TRIAL_STATUSES = _interned("Recruiting", "Active, not recruiting", "Completed", "Terminated", "Withdrawn")
+
+# Per-trial integer columns for search_clinical_trials; the
+# category columns index its local phase/status/sponsor/endpoint lists
+_TRIAL_SUMMARY_INT_FIELDS = (
+    ("nct", 10000000, 99999999),
+    ("phase", 0, 3),
+    ("status", 0, 2),
+    ("sponsor", 0, 2),
+    ("enrollment", 100, 1000),
+    ("target_enrollment", 100, 1000),
+    ("secondary_endpoint", 0, 2),
+    ("classification_phase", 0, 3),
+)
+_TRIAL_SUMMARY_LOW = np.array([low for _, low, _ in _TRIAL_SUMMARY_INT_FIELDS], dtype=np.uint64)
+_TRIAL_SUMMARY_SPAN = np.array([high - low + 1 for _, low, high in _TRIAL_SUMMARY_INT_FIELDS], dtype=np.uint64)
+
+
+def _draw_int_fields(low: np.ndarray, span: np.ndarray, shape: tuple) -> np.ndarray:
+    """Integers in [low, low + span) per trailing column, for an array of the given leading shape"""
+    return low + _RNG.bit_generator.random_raw(shape + (len(low),)) % span
+
+
+_EXPIRY_YEARS = (2026, 2027, 2028, 2029, 2030)
+# Pre-formatted date parts, indexed by a drawn int instead of a :02d spec
+_MM = tuple(f"{m:02d}" for m in range(1, 13))
+_DD = tuple(f"{d:02d}" for d in range(1, 29))
+
+# Per-patent integers for search_patents; month and day index
+# _MM/_DD, and days stop at 28 so every month is valid without clamping
+_PATENT_SUMMARY_INT_FIELDS = (
+    ("expiry_year", 0, 4),
+    ("expiry_month", 0, 11),
+    ("expiry_day", 0, 27),
+    ("assignee", 0, 2),
+)
+_PATENT_SUMMARY_LOW = np.array([low for _, low, _ in _PATENT_SUMMARY_INT_FIELDS], dtype=np.uint64)
+_PATENT_SUMMARY_SPAN = np.array([high - low + 1 for _, low, high in _PATENT_SUMMARY_INT_FIELDS], dtype=np.uint64)
+
+_GROWTH_EXPONENTS = np.array((-4, -3, -2, -1, 0, 5), dtype=float)
+_HIST_YEARS = np.arange(2020, 2025)
+_HIST_GROWTH_MASK = np.array((0.0, 1.0, 1.0, 1.0, 1.0))  # no growth figure for the base year
+
+
+# Float draw layout for search_exim
+_EXIM_SUMMARY_UNIFORM = _uniform_layout(
+    trade=((500000, 400000, 5, 4), (2000000, 1500000, 50, 40), 4, (0, 0, 2, 2)),
+    exp_volume=(100000, 500000, 5, 0),
+    exp_value=(1, 15, 5, 2),
+    exp_price=(10, 100, 5, 2),
+    imp_volume=(80000, 400000, 5, 0),
+    imp_value=(1, 12, 5, 2),
+    imp_price=(10, 100, 5, 2),
+    q3_spike=(-5, 25, 1, 2),
+)
+
+_MARKET_TRENDS = (
+    "Growing demand in emerging markets with 15% CAGR",
+    "Steady growth in developed markets with price compression",
+    "Rapid expansion in Asia-Pacific (20% YoY)",
+    "Consolidation in North America, growth in international",
+    "Strong uptake in novel indication expansion",
+)
+_MARKET_MATURITY = ("Growth", "Mature", "Decline", "Emerging")
+_REGION_MATURITY = ("Mature", "Growth", "Emerging")
+_PATENT_ASSIGNEES = ("BigPharma Corp", "Generic Pharma Inc", "Innovation Labs")
+_TRIAL_SUMMARY_INDICATIONS = ("Heart Failure", "Diabetes Prevention", "Oncology", "Respiratory Disease")
+_TRIAL_SUMMARY_SPONSORS = ("Academic Medical Center", "Innovative Therapeutics", "BigPharma Corp")
+_TRIAL_SUMMARY_ENDPOINTS = ("Quality of Life", "Biomarkers", "Pharmacokinetics")
+
+
+# Static parts of the flat metadata blocks. Each call copies its skeleton
+# (a C-level table copy) and sets only the per-call fields; key order
+# matches the original literals. None marks a field filled per call.
+_IQVIA_DATA_QUALITY = {
+    "yyd_flag": None,
+    "currency_normalized": "USD (using average annual FX rates)",
+    "name_matching": "Fuzzy matching applied",
+    "data_completeness": None,
+    "last_update": None,
+    "confidence_score": None,
+}
+
+# Response skeleton for search_exim: the static blocks are
+# shared between calls (the _memoized copy keeps callers from mutating them)
+_EXIM_SUMMARY_EXPORTERS = ("China", "India", "USA", "Germany", "Japan")
+_EXIM_SUMMARY_IMPORTERS = ("USA", "Germany", "France", "UK", "Japan")
+_EXIM_SUMMARY_TREND = {
+    "q3_import_spike_percent": None,
+    "insight": "Sudden spikes indicate potential launches or supply diversification",
+    "yoy_comparison": "QoQ growth analysis available",
+}
+_EXIM_SUMMARY_SKELETON = {
+    "molecule": None,
+    "trade_summary": None,
+    "top_exporters": None,
+    "top_importers": None,
+    "volume_vs_value_analysis": {
+        "note": "Price erosion detected in generic segments",
+        "premium_pricing_zones": ["Japan", "USA"],
+        "commodity_pricing_zones": ["India", "China"],
+    },
+    "trend_detection": None,
+    "unit_conversion_status": "All data standardized to kg",
+    "_anomalies": {
+        "outlier_transactions_flagged": True,
+        "outliers_definition": "Unit price >2 std dev from mean (potential samples/R&D)",
+        "hs_code_note": "If basket code used, results may include similar molecules",
+    },
+}
+
+# (source, credibility, topic, lowercased source for the URL host, source
+# type) for web_search
+_WEB_SUMMARY_SOURCES = tuple(
+    (source, credibility, topic, source.lower(), "HIGH-CREDIBILITY" if credibility >= 8 else "VERIFY")
+    for source, credibility, topic in (
+        ("FDA.gov", 10, "FDA approval"),
+        ("EMA.europa.eu", 10, "European regulatory news"),
+        ("Nature Medicine", 9, "Clinical research"),
+        ("The Lancet", 9, "Peer-reviewed study"),
+        ("American Heart Association", 8, "Clinical guidelines"),
+        ("NIH.gov", 9, "Government research"),
+    )
+)
+
+# Static blocks of search_clinical_trials, shared the same way
+_TRIAL_SUMMARY_PRIMARY_ENDPOINTS = ["Overall Survival (OS)", "Progression-Free Survival (PFS)", "Safety/Tolerability"]
+_TRIAL_SUMMARY_MESH_SYNONYMS = {
+    "Heart Failure": ["Heart Decompensation", "Cardiac Failure"],
+    "Diabetes": ["Diabetes Mellitus", "Glycemic Control"],
+    "Oncology": ["Neoplasm", "Malignancy", "Cancer"],
+}
+_TRIAL_SUMMARY_METADATA = {
+    "filters_applied": "Recruiting + Active, not recruiting",
+    "endpoint_extraction": "Primary and secondary endpoints extracted",
+    "mesh_mapping": "Disease synonyms mapped (e.g., Breast Cancer → Carcinoma)",
+    "status_clarity": "Terminated/Withdrawn distinguished from Completed",
+    "timeline_estimation": "Enabled based on phase and enrollment",
+}
+
+
+# Per-key memoization for the search_* mocks: a demo session asking about
+# the same molecule again gets the same data, at the cost of one copy
+_MEMO_MAXSIZE = 256
+_memoized_fns = []
+
+
+def _memoized(fn):
+    """
+    lru_cache a one-argument search_* mock. Results are JSON-shaped, so the
+    cache holds each result serialized once; every call returns an orjson
+    loads of those bytes (several times cheaper than copy.deepcopy) and
+    callers can mutate it freely. The wrapper's .json(key) returns the
+    cached bytes themselves.
+    """
+    @lru_cache(maxsize=_MEMO_MAXSIZE)
+    def to_json(key: str) -> bytes:
+        return orjson.dumps(fn(key))
+
+    _memoized_fns.append(to_json)
+
+    @wraps(fn)
+    def wrapper(key: str) -> Dict:
+        return orjson.loads(to_json(key))
+
+    wrapper.json = to_json
+    wrapper.cache_info = to_json.cache_info
+    return wrapper
+
+
+# Slotted records returned by MockDataSources.search_iqvia_fast, for
+# in-process consumers that read fields by attribute; to_dict() produces the
+# nested dict that search_iqvia returns (and the API serializes). to_dict
+# spells out each dict literal: measured against dict(zip(fields, values))
+# and a getattr comprehension over __slots__, the literal is 3-4x faster
+
+@dataclass(slots=True)
+class MarketOverview:
+    tam_usd_million: float
+    current_market_size_2024_usd_million: float
+    cagr_5yr_percent: float
+    market_trend: str
+    therapeutic_area: str
+    market_maturity: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "tam_usd_million": self.tam_usd_million,
+            "current_market_size_2024_usd_million": self.current_market_size_2024_usd_million,
+            "cagr_5yr_percent": self.cagr_5yr_percent,
+            "market_trend": self.market_trend,
+            "therapeutic_area": self.therapeutic_area,
+            "market_maturity": self.market_maturity,
+        }
+
+
+@dataclass(slots=True)
+class CompetitorShare:
+    rank: int
+    manufacturer: str
+    market_share_percent: float
+    revenue_2024_usd_million: float
+    yoy_growth_percent: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "rank": self.rank,
+            "manufacturer": self.manufacturer,
+            "market_share_percent": self.market_share_percent,
+            "revenue_2024_usd_million": self.revenue_2024_usd_million,
+            "yoy_growth_percent": self.yoy_growth_percent,
+        }
+
+
+@dataclass(slots=True)
+class CompetitiveLandscape:
+    total_competitors: int
+    top_10_manufacturers: List[CompetitorShare]
+    hhi_index: float
+    competitive_intensity: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "total_competitors": self.total_competitors,
+            "top_10_manufacturers": [c.to_dict() for c in self.top_10_manufacturers],
+            "hhi_index": self.hhi_index,
+            "competitive_intensity": self.competitive_intensity,
+        }
+
+
+@dataclass(slots=True)
+class SegmentFigures:
+    """One formulation or dosage-strength segment"""
+    revenue_usd_million: float
+    percent: float
+    volume_units: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "revenue_usd_million": self.revenue_usd_million,
+            "percent": self.percent,
+            "volume_units": self.volume_units,
+        }
+
+
+@dataclass(slots=True)
+class RegionFigures:
+    revenue_usd_million: float
+    percent: float
+    growth_rate_percent: float
+    market_maturity: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "revenue_usd_million": self.revenue_usd_million,
+            "percent": self.percent,
+            "growth_rate_percent": self.growth_rate_percent,
+            "market_maturity": self.market_maturity,
+        }
+
+
+@dataclass(slots=True)
+class HistoricalSeries:
+    """2020-2024 history as parallel columns; rows are built only by to_rows()"""
+    year: np.ndarray
+    revenue_usd_million: np.ndarray
+    volume_units: np.ndarray
+    growth_percent: np.ndarray
+    market_share_top3_percent: np.ndarray
+
+    def to_rows(self) -> List[Dict]:
+        rows = [
+            {
+                "year": year,
+                "revenue_usd_million": revenue,
+                "volume_units": volume,
+                "growth_percent": growth,
+                "market_share_top3_percent": top3,
+            }
+            for year, revenue, volume, growth, top3 in zip(
+                self.year.tolist(),
+                self.revenue_usd_million.tolist(),
+                self.volume_units.tolist(),
+                self.growth_percent.tolist(),
+                self.market_share_top3_percent.tolist(),
+            )
+        ]
+        rows[0]["growth_percent"] = 0  # base year has no prior-year growth
+        return rows
+
+
+@dataclass(slots=True)
+class IqviaResult:
+    molecule: str
+    brand_name: str
+    market_overview: MarketOverview
+    competitive_landscape: CompetitiveLandscape
+    formulation_segmentation: Dict[str, SegmentFigures]
+    regional_breakdown: Dict[str, RegionFigures]
+    historical_data: HistoricalSeries
+    dosage_strength_breakdown: Dict[str, SegmentFigures]
+    data_quality: Dict
+
+    def to_dict(self) -> Dict:
+        return {
+            "molecule": self.molecule,
+            "brand_name": self.brand_name,
+            "market_overview": self.market_overview.to_dict(),
+            "competitive_landscape": self.competitive_landscape.to_dict(),
+            "formulation_segmentation": {k: v.to_dict() for k, v in self.formulation_segmentation.items()},
+            "regional_breakdown": {k: v.to_dict() for k, v in self.regional_breakdown.items()},
+            "historical_data": self.historical_data.to_rows(),
+            "dosage_strength_breakdown": {k: v.to_dict() for k, v in self.dosage_strength_breakdown.items()},
+            "_data_quality": self.data_quality,
+        }
 
 
 class MockDataSources:
     """Mock data sources simulating real pharmaceutical databases with 5x expanded data"""
 
-    # Comprehensive molecule database
+    # Comprehensive molecule database. The flat reference lists below are
+    # tuples so the compiler folds each into one marshaled .pyc constant
     MOLECULES = {
         "Metformin": {"ta": "Diabetes", "brand": "Glucophage"},
         "Lisinopril": {"ta": "Cardiovascular", "brand": "Prinivil"},
@@ -22,699 +484,211 @@ class MockDataSources:
         "Losartan": {"ta": "Cardiovascular", "brand": "Cozaar"},
     }
     
-    MANUFACTURERS = [
+    MANUFACTURERS = (
         "Pfizer", "Merck", "AstraZeneca", "Novartis", "Johnson & Johnson",
         "Roche", "Sanofi", "GlaxoSmithKline", "Eli Lilly", "Bristol Myers Squibb",
         "Amgen", "Gilead", "Abbvie", "Regeneron", "Moderna",
         "Allergan", "Teva", "Mylan", "Sandoz", "Hospira"
-    ]
+    )
     
-    SPONSORS = [
+    SPONSORS = (
         "Academic Medical Center", "Innovative Therapeutics", "BigPharma Corp",
         "Clinical Research Institute", "University Hospital", "National Cancer Institute",
         "Veterans Affairs", "Mayo Clinic", "Stanford University", "Harvard Medical School",
         "Memorial Sloan Kettering", "Cleveland Clinic", "Johns Hopkins", "Dana-Farber"
-    ]
+    )
     
-    INDICATIONS = [
+    INDICATIONS = (
         "Type 2 Diabetes", "Hypertension", "Heart Failure", "Atrial Fibrillation",
         "Breast Cancer", "Colorectal Cancer", "Lung Cancer", "Melanoma",
         "Crohn's Disease", "Ulcerative Colitis", "Rheumatoid Arthritis", "Psoriasis",
         "COPD", "Asthma", "Pneumonia", "COVID-19"
-    ]
+    )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every memoized search_* result so the next calls regenerate"""
+        for cached in _memoized_fns:
+            cached.cache_clear()
 
     @staticmethod
+    @_memoized
     def search_iqvia(molecule: str) -> Dict:
         """Mock IQVIA market data - 5x expanded with multiple molecules and regions"""
+        return MockDataSources.search_iqvia_fast(molecule).to_dict()
+
+    @staticmethod
+    def search_iqvia_json(molecule: str) -> bytes:
+        """search_iqvia serialized to JSON bytes, for callers that only forward it"""
+        return MockDataSources.search_iqvia.json(molecule)
+
+    @staticmethod
+    def search_iqvia_fast(molecule: str) -> IqviaResult:
+        """search_iqvia as slotted records, for consumers that read fields directly"""
         molecule_data = MockDataSources.MOLECULES.get(molecule, {"ta": "Multi-indication", "brand": molecule})
         
+        # Draw every random value up front: all floats in one vectorized
+        # call (scaled and rounded there), plus one integer vector for the
+        # categorical picks
+        u = _draw_uniform(_IQVIA_UNIFORM)
+        ri = _draw_ints(16)
+        today = _today_ordinal()
+        
         # Generate base metrics
-        base_revenue = random.uniform(300, 2500)
-        cagr = random.uniform(3, 18)
+        base_revenue, cagr, hhi, confidence = u["base"]
+        cagr_percent = round(cagr, 2)
         
-        # Generate regional data
-        regions = {
-            "North America": {"percent": random.uniform(35, 55), "revenue_share": base_revenue * random.uniform(0.35, 0.55)},
-            "Europe": {"percent": random.uniform(25, 40), "revenue_share": base_revenue * random.uniform(0.25, 0.40)},
-            "Asia-Pacific": {"percent": random.uniform(10, 30), "revenue_share": base_revenue * random.uniform(0.10, 0.30)},
-            "Latin America": {"percent": random.uniform(3, 10), "revenue_share": base_revenue * random.uniform(0.03, 0.10)},
-            "Middle East & Africa": {"percent": random.uniform(2, 8), "revenue_share": base_revenue * random.uniform(0.02, 0.08)},
-        }
+        # Revenue at growth exponents -4..0 (2020-2024 history) and +5 (TAM),
+        # computed and rounded in one vector op
+        revenue = np.round(base_revenue * np.power(1 + cagr * 0.01, _GROWTH_EXPONENTS), 2)
+        hist_revenue, tam = revenue[:5], float(revenue[5])
         
         # Generate competitive landscape
-        top_competitors = random.sample(MockDataSources.MANUFACTURERS, min(10, len(MockDataSources.MANUFACTURERS)))
+        manufacturers = MockDataSources.MANUFACTURERS
+        top_competitors = _sample_k(manufacturers, min(10, len(manufacturers)))
         
-        return {
-            "molecule": molecule,
-            "brand_name": molecule_data["brand"],
-            "market_overview": {
-                "tam_usd_million": round(base_revenue * (1 + cagr/100) ** 5, 2),
-                "current_market_size_2024_usd_million": round(base_revenue, 2),
-                "cagr_5yr_percent": round(cagr, 2),
-                "market_trend": random.choice([
-                    "Growing demand in emerging markets with 15% CAGR",
-                    "Steady growth in developed markets with price compression",
-                    "Rapid expansion in Asia-Pacific (20% YoY)",
-                    "Consolidation in North America, growth in international",
-                    "Strong uptake in novel indication expansion"
-                ]),
-                "therapeutic_area": molecule_data["ta"],
-                "market_maturity": random.choice(["Growth", "Mature", "Decline", "Emerging"])
-            },
-            "competitive_landscape": {
-                "total_competitors": random.randint(15, 45),
-                "top_10_manufacturers": [
-                    {
-                        "rank": i+1,
-                        "manufacturer": competitor,
-                        "market_share_percent": round(random.uniform(2, 25) if i < 3 else random.uniform(1, 8), 2),
-                        "revenue_2024_usd_million": round(base_revenue * random.uniform(0.02, 0.25), 2),
-                        "yoy_growth_percent": round(random.uniform(-5, 20), 2)
-                    }
+        data_quality = _IQVIA_DATA_QUALITY.copy()
+        data_quality["yyd_flag"] = bool(ri[9] & 1)
+        data_quality["data_completeness"] = f"{85 + ri[10] % 16}%"
+        data_quality["last_update"] = _fmt_ordinal(today - (1 + ri[11] % 30))
+        data_quality["confidence_score"] = confidence
+        
+        return IqviaResult(
+            molecule=molecule,
+            brand_name=molecule_data["brand"],
+            market_overview=MarketOverview(
+                tam_usd_million=tam,
+                current_market_size_2024_usd_million=round(base_revenue, 2),
+                cagr_5yr_percent=cagr_percent,
+                market_trend=_MARKET_TRENDS[ri[0] % len(_MARKET_TRENDS)],
+                therapeutic_area=molecule_data["ta"],
+                market_maturity=_MARKET_MATURITY[ri[1] % len(_MARKET_MATURITY)]
+            ),
+            competitive_landscape=CompetitiveLandscape(
+                total_competitors=15 + ri[2] % 31,
+                top_10_manufacturers=[
+                    CompetitorShare(
+                        i+1,
+                        competitor,
+                        u["share"][i],
+                        u["comp_revenue"][i],
+                        u["comp_yoy"][i]
+                    )
                     for i, competitor in enumerate(top_competitors[:10])
                 ],
-                "hhi_index": round(random.uniform(800, 3500), 0),  # Market concentration indicator
-                "competitive_intensity": "HIGH" if random.choice([True, False]) else "MODERATE"
+                hhi_index=hhi,  # Market concentration indicator
+                competitive_intensity="HIGH" if ri[3] & 1 else "MODERATE"
+            ),
+            formulation_segmentation={
+                segment: SegmentFigures(
+                    u["form_revenue"][k],
+                    u["form_pct"][k],
+                    u["form_volume"][k]
+                )
+                for k, segment in enumerate(_FORMULATIONS)
             },
-            "formulation_segmentation": {
-                "oral": {
-                    "revenue_usd_million": round(base_revenue * random.uniform(0.50, 0.70), 2),
-                    "percent": round(random.uniform(50, 70), 1),
-                    "volume_units": round(random.uniform(500000, 5000000), 0)
-                },
-                "injectable": {
-                    "revenue_usd_million": round(base_revenue * random.uniform(0.15, 0.35), 2),
-                    "percent": round(random.uniform(15, 35), 1),
-                    "volume_units": round(random.uniform(100000, 800000), 0)
-                },
-                "topical": {
-                    "revenue_usd_million": round(base_revenue * random.uniform(0.05, 0.20), 2),
-                    "percent": round(random.uniform(5, 20), 1),
-                    "volume_units": round(random.uniform(50000, 300000), 0)
-                },
-                "other": {
-                    "revenue_usd_million": round(base_revenue * random.uniform(0.02, 0.10), 2),
-                    "percent": round(random.uniform(2, 10), 1),
-                    "volume_units": round(random.uniform(10000, 100000), 0)
-                }
-            },
-            "regional_breakdown": {
-                region: {
-                    "revenue_usd_million": round(region_data["revenue_share"], 2),
-                    "percent": round(region_data["percent"], 1),
-                    "growth_rate_percent": round(random.uniform(-2, 22), 2),
-                    "market_maturity": random.choice(["Mature", "Growth", "Emerging"])
-                }
-                for region, region_data in regions.items()
+            regional_breakdown={
+                region: RegionFigures(
+                    u["region_share"][k],
+                    u["region_pct"][k],
+                    u["region_growth"][k],
+                    _REGION_MATURITY[ri[4 + k] % len(_REGION_MATURITY)]
+                )
+                for k, region in enumerate(_REGIONS)
             },
-            "historical_data": [
-                {
-                    "year": 2020 + i,
-                    "revenue_usd_million": round(base_revenue * (1 + cagr/100) ** (i - 4), 2),
-                    "volume_units": round(random.uniform(1000000, 10000000), 0),
-                    "growth_percent": round(cagr, 2) if i > 0 else 0,
-                    "market_share_top3_percent": round(random.uniform(35, 65), 1)
-                }
-                for i in range(5)
-            ],
-            "dosage_strength_breakdown": {
-                f"Strength {j}": {
-                    "revenue_usd_million": round(base_revenue * random.uniform(0.10, 0.30), 2),
-                    "percent": round(random.uniform(10, 30), 1),
-                    "volume_units": round(random.uniform(100000, 500000), 0)
-                }
-                for j in range(1, 5)
+            historical_data=HistoricalSeries(
+                _HIST_YEARS,
+                hist_revenue,
+                np.array(u["hist_volume"]),
+                _HIST_GROWTH_MASK * cagr_percent,
+                np.array(u["hist_top3"])
+            ),
+            dosage_strength_breakdown={
+                strength: SegmentFigures(
+                    u["dose_revenue"][k],
+                    u["dose_pct"][k],
+                    u["dose_volume"][k]
+                )
+                for k, strength in enumerate(_DOSE_STRENGTHS)
             },
-            "_data_quality": {
-                "yyd_flag": random.choice([True, False]),
-                "currency_normalized": "USD (using average annual FX rates)",
-                "name_matching": "Fuzzy matching applied",
-                "data_completeness": f"{random.randint(85, 100)}%",
-                "last_update": (datetime.now() - timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d"),
-                "confidence_score": round(random.uniform(0.80, 0.99), 2)
-            }
-        }
+            data_quality=data_quality
+        )
 
     @staticmethod
+    @_memoized
     def search_exim(molecule: str) -> Dict:
-        """Mock EXIM trade data - 5x expanded with multiple countries and quarters"""
-        countries_exporters = ["China", "India", "USA", "Germany", "Japan", "Switzerland", "Belgium", "Ireland"]
-        countries_importers = ["USA", "Germany", "France", "UK", "Japan", "Canada", "Australia", "Spain"]
-        
-        return {
-            "molecule": molecule,
-            "hs_code": f"{random.randint(2900, 3004)}.{random.randint(10, 90)}",
-            "hs_code_status": random.choice(["Specific code available", "Basket code (includes similar molecules)", "Ambiguous - verify"]),
-            "trade_summary": {
-                "total_imports_kg": round(random.uniform(500000, 5000000), 0),
-                "total_exports_kg": round(random.uniform(400000, 4500000), 0),
-                "total_import_value_usd_million": round(random.uniform(5, 150), 2),
-                "total_export_value_usd_million": round(random.uniform(4, 140), 2),
-                "import_growth_yoy_percent": round(random.uniform(-15, 35), 2),
-                "export_growth_yoy_percent": round(random.uniform(-10, 30), 2)
-            },
-            "top_exporters": [
-                {
-                    "rank": i + 1,
-                    "country": exporter,
-                    "export_volume_kg": round(random.uniform(100000, 1500000), 0),
-                    "export_value_usd_million": round(random.uniform(1, 50), 2),
-                    "unit_price_usd_per_kg": round(random.uniform(5, 100), 2),
-                    "yoy_growth_percent": round(random.uniform(-10, 40), 2),
-                    "market_share_percent": round(random.uniform(5, 25), 1)
-                }
-                for i, exporter in enumerate(random.sample(countries_exporters, min(8, len(countries_exporters))))
-            ],
-            "top_importers": [
-                {
-                    "rank": i + 1,
-                    "country": importer,
-                    "import_volume_kg": round(random.uniform(80000, 1200000), 0),
-                    "import_value_usd_million": round(random.uniform(1, 45), 2),
-                    "unit_price_usd_per_kg": round(random.uniform(5, 100), 2),
-                    "yoy_growth_percent": round(random.uniform(-12, 35), 2),
-                    "market_share_percent": round(random.uniform(5, 20), 1)
-                }
-                for i, importer in enumerate(random.sample(countries_importers, min(8, len(countries_importers))))
-            ],
-            "quarterly_trends": [
-                {
-                    "quarter": f"Q{q} 2024",
-                    "import_volume_kg": round(random.uniform(100000, 1200000), 0),
-                    "export_volume_kg": round(random.uniform(80000, 1100000), 0),
-                    "avg_import_price_usd_kg": round(random.uniform(10, 90), 2),
-                    "avg_export_price_usd_kg": round(random.uniform(12, 95), 2)
-                }
-                for q in range(1, 5)
-            ],
-            "volume_vs_value_analysis": {
-                "price_erosion_detected": random.choice([True, False]),
-                "price_erosion_percent": round(random.uniform(-15, 5), 2),
-                "premium_pricing_regions": random.sample(["Japan", "USA", "Switzerland", "Germany"], random.randint(1, 3)),
-                "commodity_pricing_regions": random.sample(["India", "China", "Vietnam", "Thailand"], random.randint(1, 3)),
-                "price_elasticity": round(random.uniform(0.5, 2.5), 2)
-            },
-            "trend_detection": {
-                "recent_spikes_detected": random.choice([True, False]),
-                "q3_2024_import_spike_percent": round(random.uniform(-10, 45), 2),
-                "likely_driver": random.choice(["New product launch", "Supply diversification", "Stockpiling", "Market expansion"]),
-                "supply_chain_disruption_risk": random.choice(["LOW", "MEDIUM", "HIGH"])
-            },
-            "supplier_analysis": {
-                "concentration_ratio_top3": round(random.uniform(30, 75), 1),
-                "supplier_diversification": random.choice(["Low risk", "Moderate risk", "High concentration"]),
-                "new_suppliers_emerging": random.randint(0, 5),
-                "supplier_reliability_score": round(random.uniform(0.6, 0.95), 2)
-            },
-            "unit_standardization": "All data standardized to kg (conversions: g/kg=1, mt=1000)",
-            "_anomalies": {
-                "outlier_transactions_flagged": random.choice([True, False]),
-                "outliers_definition": "Unit price >2 std dev from mean",
-                "suspicious_shipments": random.randint(0, 5),
-                "sample_shipments_detected": random.choice([True, False]),
-                "rd_shipment_volumes": round(random.uniform(0, 50000), 0)
-            },
-            "_data_quality": {
-                "completeness": f"{random.randint(80, 100)}%",
-                "timeliness": "Updated monthly",
-                "accuracy_score": round(random.uniform(0.85, 0.99), 2)
-            }
-        }
-
-    @staticmethod
-    def search_patents(molecule: str) -> Dict:
-        """Mock patent database - 5x expanded with multiple jurisdictions"""
-        expiry_years = [2026, 2027, 2028, 2029, 2030, 2031]
-        patent_types = ["Composition of Matter", "Process Patent", "Formulation Patent", "Use Patent", "Method Patent"]
-        jurisdictions_list = ["US", "EU", "JP", "CA", "AU", "IN", "CH"]
-        
-        return {
-            "molecule": molecule,
-            "total_patent_families": random.randint(5, 25),
-            "patents": [
-                {
-                    "patent_id": f"{jur}{10000000 + i}",
-                    "jurisdiction": jur,
-                    "title": random.choice([
-                        f"{molecule} for novel indication",
-                        f"Process patent for {molecule} synthesis",
-                        f"Extended release formulation of {molecule}",
-                        f"Salt forms of {molecule}",
-                        f"Combination therapy with {molecule}"
-                    ]),
-                    "patent_type": random.choice(patent_types),
-                    "filing_date": (datetime.now() - timedelta(days=365*random.randint(8, 20))).strftime("%Y-%m-%d"),
-                    "grant_date": (datetime.now() - timedelta(days=365*random.randint(5, 15))).strftime("%Y-%m-%d"),
-                    "expiry_date": f"{random.choice(expiry_years)}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                    "status": random.choice(["Active", "Pending", "Expired", "Abandoned"]),
-                    "assignee": random.choice(MockDataSources.MANUFACTURERS),
-                    "strength_ranking": "HIGH" if i == 0 else "MEDIUM" if i == 1 else "LOW",
-                    "_risk_flag": "🔴 HIGH RISK" if i == 0 and random.choice([True, False]) else "🟡 MEDIUM RISK" if i < 3 else "🟢 LOW RISK",
-                    "_fto_impact": "Blocks generic entry" if i == 0 else "Limited impact (process/formulation)" if i < 3 else "No impact (expired/expiring)",
-                    "litigation_status": random.choice(["None", "Pending", "Paragraph IV challenge", "Appeal"]),
-                    "legal_fees_status": random.choice(["Paid", "Current", "Lapsed"])
-                }
-                for jur in random.sample(jurisdictions_list, random.randint(3, 5))
-                for i in range(random.randint(2, 5))
-            ],
-            "litigation_status": {
-                "active_cases": random.randint(0, 5),
-                "orange_book_certs": random.randint(0, 3),
-                "paragraph_iv_challenges": random.randint(0, 2),
-                "recent_litigation": random.choice([
-                    "Merck v. Generics Inc. (Pending)",
-                    "None",
-                    "First Generics v. BigPharma (Appeal)",
-                    "Settlement reached Q3 2024"
-                ]),
-                "settlements": random.randint(0, 2)
-            },
-            "loss_of_exclusivity_analysis": {
-                "primary_patent_expiry": f"{random.choice(expiry_years)}-{random.randint(1,12):02d}-15",
-                "secondary_patents_count": random.randint(0, 5),
-                "evergreening_strategy": "Detected" if random.choice([True, False]) else "Not detected",
-                "spc_extension_possible": random.choice([True, False]),
-                "spc_expiry": f"{random.choice(expiry_years) + 5}-{random.randint(1,12):02d}-15" if random.choice([True, False]) else "N/A",
-                "pte_extension_us": random.randint(0, 5),
-                "estimated_generic_entry": f"Q{random.randint(1,4)} {random.choice(expiry_years) + 1}",
-                "expected_price_erosion_percent": round(random.uniform(30, 80), 1)
-            },
-            "jurisdiction_summary": {
-                "us": {
-                    "status": random.choice(["🔴 HIGH RISK", "🟡 MEDIUM RISK", "🟢 LOW RISK"]),
-                    "primary_patents": random.randint(1, 5),
-                    "expiry_date": f"{random.choice(expiry_years)}-06-15"
-                },
-                "eu": {
-                    "status": random.choice(["🔴 HIGH RISK", "🟡 MEDIUM RISK", "🟢 LOW RISK"]),
-                    "primary_patents": random.randint(1, 4),
-                    "spc_available": random.choice([True, False])
-                },
-                "japan": {
-                    "status": random.choice(["🔴 HIGH RISK", "🟡 MEDIUM RISK", "🟢 LOW RISK"]),
-                    "primary_patents": random.randint(0, 3),
-                    "expiry_date": f"{random.choice(expiry_years)}-03-20"
-                },
-                "rest_of_world": {
-                    "coverage": f"{random.randint(20, 80)}% of markets",
-                    "status": "Mixed protection"
-                }
-            },
-            "_metadata": {
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
-                "data_source": "USPTO + Orange Book + WIPO + EPO",
-                "confidence_score": round(random.uniform(0.85, 0.99), 2),
-                "last_update": (datetime.now() - timedelta(days=random.randint(1, 15))).strftime("%Y-%m-%d"),
-                "recommendations": [
-                    "Monitor upcoming Paragraph IV challenges",
-                    "Prepare lifecycle management strategy",
-                    "Consider authorized generics or co-promotion",
-                    "Evaluate patent extension strategies"
-                ]
-            }
-        }
-
-    @staticmethod
-    def search_clinical_trials(molecule: str) -> Dict:
-        """Mock ClinicalTrials.gov data - 5x expanded with detailed trial info"""
-        phases = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
-        statuses = ["Recruiting", "Active, not recruiting", "Completed", "Terminated", "Withdrawn"]
-        
-        trials_by_indication = {}
+        """Mock EXIM trade data with volume, value, and supply chain analysis"""
+        # Every float in one vectorized draw, already rounded (see search_iqvia)
+        u = _draw_uniform(_EXIM_SUMMARY_UNIFORM)
+        trade = u["trade"]
+        exp_volume, exp_value, exp_price = u["exp_volume"], u["exp_value"], u["exp_price"]
+        imp_volume, imp_value, imp_price = u["imp_volume"], u["imp_value"], u["imp_price"]
         
-        for indication in random.sample(MockDataSources.INDICATIONS, random.randint(3, 6)):
-            trials_by_indication[indication] = [
-                {
-                    "nct_id": f"NCT{random.randint(10000000, 99999999)}",
-                    "title": f"{molecule} in {indication}",
-                    "phase": random.choice(phases),
-                    "status": random.choice(statuses),
-                    "sponsor": random.choice(MockDataSources.SPONSORS),
-                    "enrollment": random.randint(50, 1500),
-                    "target_enrollment": random.randint(100, 2000),
-                    "actual_enrollment": random.randint(40, 1500),
-                    "enrollment_status": random.choice(["On track", "Ahead of schedule", "Behind schedule"]),
-                    "start_date": (datetime.now() - timedelta(days=365*random.randint(1, 4))).strftime("%Y-%m-%d"),
-                    "primary_endpoints": random.sample(
-                        ["Overall Survival (OS)", "Progression-Free Survival (PFS)", "Safety/Tolerability", 
-                         "Quality of Life", "Biomarkers", "Efficacy", "Pharmacokinetics"],
-                        random.randint(1, 3)
-                    ),
-                    "secondary_endpoints": random.sample(
-                        ["Biomarkers", "Quality of Life", "Pharmacodynamics", "Economic outcomes"],
-                        random.randint(1, 2)
-                    ),
-                    "inclusion_criteria": random.choice([
-                        "Age 18-75, confirmed diagnosis",
-                        "Stage III-IV disease",
-                        "ECOG PS 0-2",
-                        "Adequate organ function"
-                    ]),
-                    "exclusion_criteria": "Prior therapy, active infection, pregnancy",
-                    "estimated_completion": (datetime.now() + timedelta(days=365*random.randint(1, 4))).strftime("%Y-%m-%d"),
-                    "estimated_completion_date_actual": (datetime.now() + timedelta(days=365*random.randint(1, 4))).strftime("%Y-%m-%d"),
-                    "results_posted": random.choice([True, False]),
-                    "termination_reason": random.choice(["N/A", "Efficacy", "Futility", "Safety"]) if random.choice([True, False]) else "N/A",
-                    "_mesh_synonyms": {
-                        "Breast Cancer": ["Breast Carcinoma", "Breast Neoplasm", "Mammary Cancer"],
-                        "Diabetes": ["Diabetes Mellitus", "Glycemic Control"],
-                        "Heart Failure": ["Cardiac Failure", "Congestive Heart Failure"],
-                    },
-                    "_trial_classification": random.choice(["Early Stage", "Late Stage", "Phase 4", "Observational"]),
-                    "_competitive_threat": "HIGH" if random.choice([True, False]) else "MODERATE",
-                }
-                for _ in range(random.randint(2, 4))
-            ]
+        trend = _EXIM_SUMMARY_TREND.copy()
+        trend["q3_import_spike_percent"] = u["q3_spike"][0]
         
-        return {
-            "molecule": molecule,
-            "total_active_trials": sum(len(v) for v in trials_by_indication.values()),
-            "total_recruiting_trials": random.randint(3, 15),
-            "trials_by_indication": trials_by_indication,
-            "pipeline_summary": {
-                "phase_1_count": random.randint(1, 5),
-                "phase_2_count": random.randint(2, 8),
-                "phase_3_count": random.randint(1, 6),
-                "phase_4_count": random.randint(0, 4),
-                "total_patients_enrolled": random.randint(500, 5000),
-                "total_estimated_patients": random.randint(1000, 10000)
-            },
-            "sponsor_analysis": {
-                "industry_sponsored": random.randint(2, 8),
-                "academic_sponsored": random.randint(1, 5),
-                "government_sponsored": random.randint(0, 3),
-                "top_sponsor": random.choice(MockDataSources.SPONSORS)
-            },
-            "timeline_analysis": {
-                "avg_phase_duration": f"{random.randint(18, 48)} months",
-                "estimated_approval_date": (datetime.now() + timedelta(days=365*random.randint(2, 5))).strftime("%Y-%m-%d"),
-                "key_milestones": [
-                    f"Phase 3 readout: Q{random.randint(1, 4)} {random.randint(2024, 2027)}",
-                    f"NDA submission: Q{random.randint(1, 4)} {random.randint(2025, 2028)}",
-                    f"Potential approval: Q{random.randint(1, 4)} {random.randint(2026, 2029)}"
-                ]
-            },
-            "_metadata": {
-                "filters_applied": "Recruiting + Active, not recruiting",
-                "endpoint_extraction": "Enabled",
-                "mesh_mapping": "Disease synonyms mapped",
-                "status_clarity": "Terminated/Withdrawn distinguished",
-                "timeline_estimation": "Enabled",
-                "data_source": "ClinicalTrials.gov",
-                "last_update": (datetime.now() - timedelta(days=random.randint(1, 7))).strftime("%Y-%m-%d")
-            }
+        result = _EXIM_SUMMARY_SKELETON.copy()
+        result["molecule"] = molecule
+        result["trade_summary"] = {
+            "total_imports_kg": trade[0],
+            "total_exports_kg": trade[1],
+            "total_import_value_usd_million": trade[2],
+            "total_export_value_usd_million": trade[3]
         }
-
-    @staticmethod
-    def search_internal_docs(query: str) -> Dict:
-        """Mock internal knowledge base - 5x expanded with multiple documents"""
-        doc_types = ["Strategic Plan", "Portfolio Review", "KOL Interview Notes", "Competitive Analysis", 
-                     "Field Feedback Report", "Market Assessment", "R&D Pipeline Review", "Budget Allocation"]
-        
-        return {
-            "query": query,
-            "total_documents_searched": random.randint(50, 200),
-            "documents_found": random.randint(3, 10),
-            "relevant_documents": [
-                {
-                    "filename": f"{random.choice(doc_types)} {random.randint(2020, 2024)}.pdf",
-                    "page": random.randint(1, 100),
-                    "relevance_score": round(random.uniform(0.65, 1.0), 2),
-                    "document_type": random.choice(doc_types),
-                    "date": (datetime.now() - timedelta(days=365*random.randint(0, 2))).strftime("%Y-%m-%d"),
-                    "excerpt": f"Document discusses {query} with relevance to market strategy",
-                    "sentiment": random.choice(["Positive", "Neutral", "Negative"]),
-                    "key_topics": random.sample(["Market Opportunity", "Competitive Risk", "R&D Investment", "Commercial Viability"], 2)
-                }
-                for _ in range(random.randint(3, 7))
-            ],
-            "key_insights": [
-                {
-                    "insight": f"Company {random.choice(['has strong presence', 'is gaining traction', 'faces competition'])} in {query} space",
-                    "source": f"Strategic Plan 2024-2026.pdf, Page {random.randint(1, 50)}",
-                    "date": datetime.now().strftime("%Y-%m-%d"),
-                    "confidence": random.choice(["High", "Medium", "Low"]),
-                    "strategic_relevance": random.choice(["High", "Medium", "Low"])
-                },
-                {
-                    "insight": "Physicians interested in once-daily formulations and improved safety profiles",
-                    "source": f"KOL Interview Notes Q3 2024.pdf, Page {random.randint(1, 30)}",
-                    "date": (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d"),
-                    "confidence": "High",
-                    "strategic_relevance": "High"
-                },
-                {
-                    "insight": "Emerging market growing 25% YoY with pricing flexibility opportunity",
-                    "source": f"Market Assessment 2024.pdf, Page {random.randint(1, 40)}",
-                    "date": (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d"),
-                    "confidence": "High",
-                    "strategic_relevance": "Medium"
-                }
-            ],
-            "field_feedback": [
-                "Market preference for oral formulations in primary care",
-                "Safety profile is key differentiator vs competitors",
-                "Pricing sensitivity in emerging markets (30-40% premium tolerance)",
-                f"Strong interest in {query} from key opinion leaders",
-                "Combination therapy opportunities identified",
-                "Unmet need in resistant/refractory cases"
-            ],
-            "strategic_alignment": {
-                "portfolio_fit": random.choice(["Excellent", "Good", "Fair", "Poor"]),
-                "capability_gap": random.choice(["Minimal", "Moderate", "Significant"]),
-                "investment_priority": random.choice(["High", "Medium", "Low"]),
-                "competitive_position": random.choice(["Leader", "Challenger", "Niche", "Emerging"])
-            },
-            "conflicting_perspectives": [
-                {
-                    "perspective_a": "Market growing rapidly",
-                    "perspective_b": "Market growth slowing",
-                    "document_a": "2024 Analysis",
-                    "document_b": "2023 Forecast",
-                    "resolution": "Growth moderating but still healthy 8-12% CAGR"
-                }
-            ] if random.choice([True, False]) else [],
-            "_metadata": {
-                "search_type": "Full-text semantic search",
-                "ocr_processing": "Enabled",
-                "citation_format": "Source: [Filename, Page #]",
-                "search_completeness": f"{random.randint(85, 100)}%",
-                "hallucination_guard": "Strict",
-                "access_level": "Confidential - Internal Use Only",
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
+        result["top_exporters"] = [
+            {
+                "country": exporter,
+                "export_volume_kg": exp_volume[i],
+                "export_value_usd_million": exp_value[i],
+                "unit_price_usd_per_kg": exp_price[i]
             }
-        }
-
-    @staticmethod
-    def web_search(query: str) -> Dict:
-        """Mock web search - 5x expanded with varied sources and recent data"""
-        trusted_sources = [
-            ("FDA.gov", 10, "Regulatory approval"),
-            ("EMA.europa.eu", 10, "European regulatory update"),
-            ("Nature Medicine", 9, "Clinical research study"),
-            ("The Lancet", 9, "Peer-reviewed publication"),
-            ("American Heart Association", 8, "Clinical guidelines"),
-            ("NIH.gov", 9, "Government research"),
-            ("JAMA", 9, "Medical journal article"),
-            ("New England Journal of Medicine", 9, "Clinical trial results"),
-            ("WHO Guidelines", 10, "International guidelines"),
-            ("Reuters Health", 7, "Health news"),
+            for i, exporter in enumerate(_EXIM_SUMMARY_EXPORTERS)
         ]
-        
-        # Generate multiple results from varied sources
-        selected_sources = random.sample(trusted_sources, min(random.randint(4, 7), len(trusted_sources)))
-        results = []
-        
-        for idx, (source, credibility, topic) in enumerate(selected_sources):
-            results.append({
-                "rank": idx + 1,
-                "title": f"Latest developments in {query}: {topic}",
-                "source": source,
-                "url": f"https://{source.lower().replace(' ', '-')}/articles/{query.replace(' ', '-')}-{idx}",
-                "publication_date": (datetime.now() - timedelta(days=random.randint(1, 180))).strftime("%Y-%m-%d"),
-                "article_date": (datetime.now() - timedelta(days=random.randint(1, 180))).strftime("%Y-%m-%d"),
-                "summary": f"Comprehensive article on {query} discussing latest advances and clinical implications",
-                "_credibility_score": credibility,
-                "_source_type": "HIGH-CREDIBILITY" if credibility >= 8 else "VERIFY",
-                "content_type": random.choice(["Research Study", "Guidelines", "News", "Opinion", "Meta-Analysis"]),
-                "snippet": f"Recent study shows {random.choice(['promising results', 'safety concerns', 'efficacy data'])} for {query}",
-                "access_status": random.choice(["Open Access", "Paywalled", "Free Summary Available"]),
-                "open_access_link": f"https://pubmedcentral.nih.gov/articles/{random.randint(1000000, 9999999)}" if random.choice([True, False]) else None
-            })
-        
-        return {
-            "query": query,
-            "total_results": random.randint(100, 5000),
-            "results_shown": len(results),
-            "results": results,
-            "guidelines": {
-                "guidelines_found": random.randint(2, 5),
-                "first_line_treatment": f"Current {random.choice(['FDA', 'EMA', 'WHO'])} guidelines recommend {query} for {random.choice(MockDataSources.INDICATIONS)}",
-                "second_line_alternatives": f"Alternative treatments: {', '.join(random.sample(['Drug A', 'Drug B', 'Drug C', 'Combination therapy'], 2))}",
-                "guideline_source": random.choice(["FDA", "EMA", "WHO", "NICE", "ASCO"]),
-                "guideline_year": 2024,
-                "date_verified": datetime.now().strftime("%Y-%m-%d"),
-                "guideline_updates": f"Updated {random.choice(['Q1', 'Q2', 'Q3', 'Q4'])} 2024"
-            },
-            "recent_news": [
-                {
-                    "headline": f"FDA approves new indication for {query}",
-                    "date": (datetime.now() - timedelta(days=random.randint(1, 90))).strftime("%Y-%m-%d"),
-                    "category": "Regulatory Approval",
-                    "impact": "High",
-                    "url": f"https://fda.gov/news/{random.randint(100000, 999999)}"
-                },
-                {
-                    "headline": f"Major acquisition in {query} space",
-                    "date": (datetime.now() - timedelta(days=random.randint(1, 120))).strftime("%Y-%m-%d"),
-                    "category": "M&A",
-                    "impact": "Medium",
-                    "url": f"https://reuters.com/health/{random.randint(100000, 999999)}"
-                },
-                {
-                    "headline": f"Safety alert issued for {query}",
-                    "date": (datetime.now() - timedelta(days=random.randint(1, 60))).strftime("%Y-%m-%d"),
-                    "category": "Safety Alert",
-                    "impact": "Critical" if random.choice([True, False]) else "Moderate",
-                    "url": f"https://fda.gov/safety/{random.randint(100000, 999999)}"
-                }
-            ],
-            "emerging_trends": [
-                f"Increased focus on {random.choice(['personalized medicine', 'combination therapies', 'rare indications'])}",
-                f"Growing interest in {random.choice(['digital health integration', 'patient monitoring', 'real-world evidence'])}",
-                f"Shift toward {random.choice(['home-based treatment', 'long-acting formulations', 'fixed-dose combinations'])}"
-            ],
-            "competitive_intelligence": {
-                "competitor_approvals": random.randint(0, 3),
-                "pipeline_updates": random.randint(1, 5),
-                "market_share_shifts": random.choice(["No significant changes", "New entrant gaining traction", "Leader consolidating position"])
-            },
-            "_metadata": {
-                "source_filter": "Whitelisted (FDA, EMA, NIH, journals)",
-                "social_media_excluded": True,
-                "paywall_detection": "Open-access prioritized",
-                "date_verification": f"Latest guideline verified as of {datetime.now().strftime('%Y-%m-%d')}",
-                "freshness": "Results from last 180 days",
-                "search_completeness": f"{random.randint(90, 100)}%",
-                "credibility_assessment": "Multiple high-credibility sources included",
-                "last_update": datetime.now().strftime("%Y-%m-%d")
-            }
-        }
-
-        """Mock IQVIA market data with TAM, CAGR, and segmentation"""
-        base_year_revenue = random.uniform(300, 800)
-        cagr = random.uniform(5, 15)
-        
-        return {
-            "molecule": molecule,
-            "market_overview": {
-                "tam_usd_million": round(base_year_revenue * (1 + cagr/100) ** 5, 2),
-                "current_market_size_2024_usd_million": round(base_year_revenue, 2),
-                "cagr_5yr_percent": round(cagr, 2),
-                "market_trend": random.choice([
-                    "Growing demand in emerging markets",
-                    "Steady growth in developed markets",
-                    "Rapid expansion in Asia-Pacific"
-                ]),
-                "therapeutic_area": random.choice(["Cardiovascular", "Diabetes", "Oncology", "Immunology"])
-            },
-            "competitive_landscape": {
-                "top_10_manufacturers": [
-                    {"rank": i+1, "manufacturer": f"{random.choice(['Pfizer', 'Novartis', 'AstraZeneca', 'Merck', 'Johnson & Johnson'])}", 
-                     "market_share_percent": round(random.uniform(3, 20), 2)}
-                    for i in range(10)
-                ]
-            },
-            "formulation_segmentation": {
-                "oral": {"revenue_usd_million": round(base_year_revenue * 0.6, 2), "percent": 60},
-                "injectable": {"revenue_usd_million": round(base_year_revenue * 0.3, 2), "percent": 30},
-                "topical": {"revenue_usd_million": round(base_year_revenue * 0.1, 2), "percent": 10}
-            },
-            "historical_data": [
-                {
-                    "year": 2020 + i,
-                    "revenue_usd_million": round(base_year_revenue * (1 + cagr/100) ** (i - 4), 2),
-                    "growth_percent": round(cagr, 2) if i > 0 else 0
-                }
-                for i in range(5)
-            ],
-            "_data_quality": {
-                "yyd_flag": False,
-                "currency_normalized": "USD (using average annual FX rates)",
-                "name_matching": "Fuzzy matching applied (e.g., Acetaminophen ≈ Paracetamol)",
-                "data_completeness": "100% (specific molecule data available)"
-            }
-        }
-
-    @staticmethod
-    def search_exim(molecule: str) -> Dict:
-        """Mock EXIM trade data with volume, value, and supply chain analysis"""
-        return {
-            "molecule": molecule,
-            "trade_summary": {
-                "total_imports_kg": round(random.uniform(500000, 2000000), 0),
-                "total_exports_kg": round(random.uniform(400000, 1500000), 0),
-                "total_import_value_usd_million": round(random.uniform(5, 50), 2),
-                "total_export_value_usd_million": round(random.uniform(4, 40), 2)
-            },
-            "top_exporters": [
-                {
-                    "country": exporter,
-                    "export_volume_kg": round(random.uniform(100000, 500000), 0),
-                    "export_value_usd_million": round(random.uniform(1, 15), 2),
-                    "unit_price_usd_per_kg": round(random.uniform(10, 100), 2)
-                }
-                for exporter in ["China", "India", "USA", "Germany", "Japan"]
-            ],
-            "top_importers": [
-                {
-                    "country": importer,
-                    "import_volume_kg": round(random.uniform(80000, 400000), 0),
-                    "import_value_usd_million": round(random.uniform(1, 12), 2),
-                    "unit_price_usd_per_kg": round(random.uniform(10, 100), 2)
-                }
-                for importer in ["USA", "Germany", "France", "UK", "Japan"]
-            ],
-            "volume_vs_value_analysis": {
-                "note": "Price erosion detected in generic segments",
-                "premium_pricing_zones": ["Japan", "USA"],
-                "commodity_pricing_zones": ["India", "China"]
-            },
-            "trend_detection": {
-                "q3_import_spike_percent": round(random.uniform(-5, 25), 2),
-                "insight": "Sudden spikes indicate potential launches or supply diversification",
-                "yoy_comparison": "QoQ growth analysis available"
-            },
-            "unit_conversion_status": "All data standardized to kg",
-            "_anomalies": {
-                "outlier_transactions_flagged": True,
-                "outliers_definition": "Unit price >2 std dev from mean (potential samples/R&D)",
-                "hs_code_note": "If basket code used, results may include similar molecules"
+        result["top_importers"] = [
+            {
+                "country": importer,
+                "import_volume_kg": imp_volume[i],
+                "import_value_usd_million": imp_value[i],
+                "unit_price_usd_per_kg": imp_price[i]
             }
-        }
+            for i, importer in enumerate(_EXIM_SUMMARY_IMPORTERS)
+        ]
+        result["trend_detection"] = trend
+        return result
 
     @staticmethod
+    @_memoized
     def search_patents(molecule: str) -> Dict:
         """Mock patent database with FTO analysis and expiry timelines"""
-        expiry_years = [2026, 2027, 2028, 2029, 2030]
+        expiry_years = _EXPIRY_YEARS
+        assignees = _PATENT_ASSIGNEES
+        # Expiry year/month/day and assignee for all three patents in one
+        # draw, plus the two summary years
+        fields = _draw_int_fields(_PATENT_SUMMARY_LOW, _PATENT_SUMMARY_SPAN, (3,)).tolist()
+        ri = _draw_ints(2)
+        today = _today_ordinal()
+        titles = (f"{molecule} for novel indication", f"Process patent for {molecule} synthesis")
+        # Fixed offsets from today, shared by all three patents
+        filing_date = _fmt_ordinal(today - 365*15)
+        grant_date = _fmt_ordinal(today - 365*12)
         
         return {
             "molecule": molecule,
             "patents": [
                 {
                     "patent_id": f"US{10000000 + i}",
-                    "title": f"{molecule} for novel indication" if i == 0 else f"Process patent for {molecule} synthesis",
+                    "title": titles[0] if i == 0 else titles[1],
                     "patent_type": "Composition of Matter" if i == 0 else "Process Patent",
                     "jurisdiction": "US",
-                    "filing_date": (datetime.now() - timedelta(days=365*15)).strftime("%Y-%m-%d"),
-                    "grant_date": (datetime.now() - timedelta(days=365*12)).strftime("%Y-%m-%d"),
-                    "expiry_date": f"{random.choice(expiry_years)}-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
+                    "filing_date": filing_date,
+                    "grant_date": grant_date,
+                    "expiry_date": f"{expiry_years[expiry_year]}-{_MM[expiry_month]}-{_DD[expiry_day]}",
                     "status": "Active",
-                    "assignee": random.choice(["BigPharma Corp", "Generic Pharma Inc", "Innovation Labs"]),
+                    "assignee": assignees[assignee],
                     "_risk_flag": "🔴 HIGH RISK" if i == 0 else "🟡 MEDIUM RISK",
                     "_fto_impact": "Blocks generic entry" if i == 0 else "Limited impact (process patent)"
                 }
-                for i in range(3)
+                for i, (expiry_year, expiry_month, expiry_day, assignee) in enumerate(fields)
             ],
             "litigation_status": {
                 "active_cases": 0,
@@ -723,10 +697,10 @@ class MockDataSources:
                 "recent_litigation": "None"
             },
             "loss_of_exclusivity_analysis": {
-                "primary_patent_expiry": f"{random.choice(expiry_years)}-06-15",
+                "primary_patent_expiry": f"{expiry_years[ri[0] % 5]}-06-15",
                 "secondary_patents_detected": 1,
                 "evergreening_strategy": "Secondary patents filed 5-7 years post-primary",
-                "estimated_generic_entry": f"{random.choice(expiry_years) + 1}"
+                "estimated_generic_entry": f"{expiry_years[ri[1] % 5] + 1}"
             },
             "jurisdiction_summary": {
                 "us_status": "🔴 HIGH RISK - Active CoM patent",
@@ -735,7 +709,7 @@ class MockDataSources:
                 "rest_of_world": "Grouped - variable protection"
             },
             "_metadata": {
-                "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+                "analysis_date": _fmt_ordinal(today),
                 "data_source": "USPTO + Orange Book + Legal dockets",
                 "recommendations": [
                     "Monitor Paragraph IV challenges",
@@ -746,57 +720,63 @@ class MockDataSources:
         }
 
     @staticmethod
+    @_memoized
     def search_clinical_trials(molecule: str) -> Dict:
         """Mock ClinicalTrials.gov data with MeSH mapping and indication grouping"""
-        indications = ["Heart Failure", "Diabetes Prevention", "Oncology", "Respiratory Disease"]
-        phases = ["Phase 1", "Phase 2", "Phase 3", "Phase 4"]
+        indications = _TRIAL_SUMMARY_INDICATIONS
+        phases = _TRIAL_PHASES
+        statuses = _TRIAL_STATUSES  # status draws 0-2: Recruiting..Completed
+        sponsors = _TRIAL_SUMMARY_SPONSORS
+        secondary_endpoints = _TRIAL_SUMMARY_ENDPOINTS
+        
+        # Two trials per indication; all their integers in one draw
+        fields = _draw_int_fields(_TRIAL_SUMMARY_LOW, _TRIAL_SUMMARY_SPAN, (len(indications), 2)).tolist()
+        ri = _draw_ints(4)
+        today = _today_ordinal()
+        # Fixed offsets from today, shared by every trial
+        start_date = _fmt_ordinal(today - 365*2)
+        estimated_completion = _fmt_ordinal(today + 365*2)
         
         trials_by_indication = {}
+        total_active = 0
         
-        for indication in indications:
+        for indication, rows in zip(indications, fields):
+            total_active += 2
+            title = f"{molecule} in {indication}"
             trials_by_indication[indication] = [
                 {
-                    "nct_id": f"NCT{random.randint(10000000, 99999999)}",
-                    "title": f"{molecule} in {indication}",
-                    "phase": random.choice(phases),
-                    "status": random.choice(["Recruiting", "Active, not recruiting", "Completed"]),
-                    "sponsor": random.choice(["Academic Medical Center", "Innovative Therapeutics", "BigPharma Corp"]),
-                    "enrollment": random.randint(100, 1000),
-                    "target_enrollment": random.randint(100, 1000),
-                    "start_date": (datetime.now() - timedelta(days=365*2)).strftime("%Y-%m-%d"),
-                    "primary_endpoints": ["Overall Survival (OS)", "Progression-Free Survival (PFS)", "Safety/Tolerability"],
-                    "secondary_endpoints": [random.choice(["Quality of Life", "Biomarkers", "Pharmacokinetics"])],
-                    "estimated_completion": (datetime.now() + timedelta(days=365*2)).strftime("%Y-%m-%d"),
-                    "_mesh_synonyms": {
-                        "Heart Failure": ["Heart Decompensation", "Cardiac Failure"],
-                        "Diabetes": ["Diabetes Mellitus", "Glycemic Control"],
-                        "Oncology": ["Neoplasm", "Malignancy", "Cancer"]
-                    },
-                    "_trial_classification": "Active Pipeline" if random.choice(phases) in ["Phase 2", "Phase 3"] else "Advanced Stage"
+                    "nct_id": f"NCT{nct}",
+                    "title": title,
+                    "phase": phases[phase],
+                    "status": statuses[status],
+                    "sponsor": sponsors[sponsor],
+                    "enrollment": enrollment,
+                    "target_enrollment": target,
+                    "start_date": start_date,
+                    "primary_endpoints": _TRIAL_SUMMARY_PRIMARY_ENDPOINTS,
+                    "secondary_endpoints": [secondary_endpoints[secondary]],
+                    "estimated_completion": estimated_completion,
+                    "_mesh_synonyms": _TRIAL_SUMMARY_MESH_SYNONYMS,
+                    "_trial_classification": "Active Pipeline" if phases[classification_phase] in ("Phase 2", "Phase 3") else "Advanced Stage"
                 }
-                for _ in range(2)
+                for nct, phase, status, sponsor, enrollment, target, secondary, classification_phase in rows
             ]
         
         return {
             "molecule": molecule,
-            "total_active_trials": sum(len(v) for v in trials_by_indication.values()),
+            "total_active_trials": total_active,
             "trials_by_indication": trials_by_indication,
             "pipeline_summary": {
-                "phase_1_count": random.randint(1, 3),
-                "phase_2_count": random.randint(2, 5),
-                "phase_3_count": random.randint(1, 4),
-                "phase_4_count": random.randint(0, 2)
+                "phase_1_count": 1 + ri[0] % 3,
+                "phase_2_count": 2 + ri[1] % 4,
+                "phase_3_count": 1 + ri[2] % 4,
+                "phase_4_count": ri[3] % 3
             },
-            "_metadata": {
-                "filters_applied": "Recruiting + Active, not recruiting",
-                "endpoint_extraction": "Primary and secondary endpoints extracted",
-                "mesh_mapping": "Disease synonyms mapped (e.g., Breast Cancer → Carcinoma)",
-                "status_clarity": "Terminated/Withdrawn distinguished from Completed",
-                "timeline_estimation": "Enabled based on phase and enrollment"
-            }
+            "_metadata": _TRIAL_SUMMARY_METADATA
         }
 
     @staticmethod
+    @_memoized
     def search_internal_docs(query: str) -> Dict:
         """Mock internal knowledge base with RAG capabilities"""
         return {
@@ -844,28 +824,33 @@ class MockDataSources:
         }
 
     @staticmethod
+    @_memoized
     def web_search(query: str) -> Dict:
         """Mock web search with credibility scoring and source filtering"""
-        trusted_sources = [
-            ("FDA.gov", 10, "FDA approval"),
-            ("EMA.europa.eu", 10, "European regulatory news"),
-            ("Nature Medicine", 9, "Clinical research"),
-            ("The Lancet", 9, "Peer-reviewed study"),
-            ("American Heart Association", 8, "Clinical guidelines"),
-            ("NIH.gov", 9, "Government research")
-        ]
+        trusted_sources = _WEB_SUMMARY_SOURCES
+        
+        # Publication offsets at ri[0..2], then guideline source, news date
+        # and news category
+        ri = _draw_ints(6)
+        today = _today_ordinal()
+        
+        # Per-query pieces built once, not per result
+        title_prefix = f"Recent developments in {query}: "
+        url_suffix = "/articles/" + query.replace(' ', '-')
+        summary = f"Latest research and regulatory updates on {query}"
+        snippet = f"Study shows promising results for {query} in clinical use"
         
         results = []
-        for source, credibility, topic in random.sample(trusted_sources, min(3, len(trusted_sources))):
+        for idx, (source, credibility, topic, host, source_type) in enumerate(_sample_k(trusted_sources, min(3, len(trusted_sources)))):
             results.append({
-                "title": f"Recent developments in {query}: {topic}",
+                "title": title_prefix + topic,
                 "source": source,
-                "url": f"https://{source.lower()}/articles/{query.replace(' ', '-')}",
-                "publication_date": (datetime.now() - timedelta(days=random.randint(1, 180))).strftime("%Y-%m-%d"),
-                "summary": f"Latest research and regulatory updates on {query}",
+                "url": "https://" + host + url_suffix,
+                "publication_date": _fmt_ordinal(today - (1 + ri[idx] % 180)),
+                "summary": summary,
                 "_credibility_score": credibility,
-                "_source_type": "HIGH-CREDIBILITY" if credibility >= 8 else "VERIFY",
-                "snippet": f"Study shows promising results for {query} in clinical use"
+                "_source_type": source_type,
+                "snippet": snippet
             })
         
         return {
@@ -874,15 +859,15 @@ class MockDataSources:
             "guidelines": {
                 "first_line_treatment": f"Current guidelines recommend {query} as first-line therapy",
                 "second_line_alternatives": "Alternative treatments available for resistant cases",
-                "guideline_source": random.choice(["FDA", "EMA", "WHO"]),
+                "guideline_source": ("FDA", "EMA", "WHO")[ri[3] % 3],
                 "guideline_year": 2024,
-                "date_verified": datetime.now().strftime("%Y-%m-%d")
+                "date_verified": _fmt_ordinal(today)
             },
             "recent_news": [
                 {
                     "headline": f"FDA approves new indication for {query}",
-                    "date": (datetime.now() - timedelta(days=random.randint(1, 90))).strftime("%Y-%m-%d"),
-                    "category": random.choice(["Regulatory Approval", "M&A", "Safety Alert"])
+                    "date": _fmt_ordinal(today - (1 + ri[4] % 90)),
+                    "category": ("Regulatory Approval", "M&A", "Safety Alert")[ri[5] % 3]
                 }
             ],
             "_metadata": {
@@ -894,3 +879,30 @@ class MockDataSources:
             }
         }
 
+
+    # JSON-bytes variants of the live search_* mocks (see search_iqvia_json),
+    # for callers that forward the payload without reading it
+    @staticmethod
+    def search_exim_json(molecule: str) -> bytes:
+        """search_exim serialized to JSON bytes"""
+        return MockDataSources.search_exim.json(molecule)
+
+    @staticmethod
+    def search_patents_json(molecule: str) -> bytes:
+        """search_patents serialized to JSON bytes"""
+        return MockDataSources.search_patents.json(molecule)
+
+    @staticmethod
+    def search_clinical_trials_json(molecule: str) -> bytes:
+        """search_clinical_trials serialized to JSON bytes"""
+        return MockDataSources.search_clinical_trials.json(molecule)
+
+    @staticmethod
+    def search_internal_docs_json(query: str) -> bytes:
+        """search_internal_docs serialized to JSON bytes"""
+        return MockDataSources.search_internal_docs.json(query)
+
+    @staticmethod
+    def web_search_json(query: str) -> bytes:
+        """web_search serialized to JSON bytes"""
+        return MockDataSources.web_search.json(query)
@@ -1,50 +1,114 @@
+import math
+import re
+from functools import lru_cache
+from typing import List
+
 from langchain_core.messages import SystemMessage
-from services.llm_service import llm
 from graph.state import State
-from prompts.system_prompts import ORCHESTRATOR_PROMPT
 
 
-def route_query(state: State) -> str:
+# Keyword-based routing table; dict order is the tie-break order
+AGENT_KEYWORDS = {
+    "clinical_trials": ("clinical trial", "patient", "study", "efficacy", "phase", "outcome"),
+    "patent": ("patent", "intellectual property", "ip", "formulation", "chemical", "drug structure"),
+    "regulatory": ("fda", "approval", "compliance", "safety", "adverse", "regulation"),
+    "scientific_journal": ("research", "literature", "published", "study", "journal", "peer review"),
+}
+
+# Inverted once at import: each distinct keyword with the agents it counts
+# for, so routing is one flat pass of substring checks
+_KEYWORD_AGENTS = tuple(
+    (kw, tuple(agent for agent, keywords in AGENT_KEYWORDS.items() if kw in keywords))
+    for kw in dict.fromkeys(kw for keywords in AGENT_KEYWORDS.values() for kw in keywords)
+)
+
+# Vocabulary per agent for the local fallback used when no keyword matches:
+# the query's word set is scored against each by cosine similarity, and
+# the LLM is only consulted when the top two scores are within
+# _SIMILARITY_MIN_GAP (including when nothing overlaps at all)
+AGENT_VOCABULARY = {
+    "clinical_trials": frozenset(
+        "clinical trial trials patient patients study studies design designs outcome outcomes "
+        "endpoint endpoints enrollment recruiting cohort randomized placebo efficacy dose dosing".split()
+    ),
+    "patent": frozenset(
+        "patent patents intellectual property formulation formulations exclusivity expiry expiration "
+        "generic generics litigation infringement molecule synthesis composition".split()
+    ),
+    "regulatory": frozenset(
+        "fda ema regulatory regulator approval approved approve compliance safety label labeling "
+        "warning warnings adverse recall submission nda bla indication".split()
+    ),
+    "scientific_journal": frozenset(
+        "published publication publications research literature scientific journal journals article "
+        "articles paper papers review evidence meta analysis findings".split()
+    ),
+}
+_SIMILARITY_MIN_GAP = 0.05
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _closest_agent(query: str):
     """
-    Router function that determines which agent(s) should handle the query
-    Returns the next node in the graph to execute
+    Return the agent whose vocabulary is most similar to the query, or None
+    if the best match is not clearly ahead of the runner-up
     """
-    system_prompt = state.get("system_prompt", ORCHESTRATOR_PROMPT)
-    messages = state.get("message", [])
-    
-    # Get the last user message
-    if not messages:
-        return "clinical_trials"  # Default agent
-    
-    last_message = messages[-1]
-    query = last_message.content.lower()
-    
-    # Keyword-based routing logic
-    clinical_keywords = ["clinical trial", "patient", "study", "efficacy", "phase", "outcome"]
-    patent_keywords = ["patent", "intellectual property", "ip", "formulation", "chemical", "drug structure"]
-    regulatory_keywords = ["fda", "approval", "compliance", "safety", "adverse", "regulation"]
-    journal_keywords = ["research", "literature", "published", "study", "journal", "peer review"]
+    words = set(_WORD_RE.findall(query))
+    if not words:
+        return None
+    scores = sorted(
+        ((len(words & vocab) / math.sqrt(len(words) * len(vocab)), agent)
+         for agent, vocab in AGENT_VOCABULARY.items()),
+        reverse=True,
+    )
+    (best, agent), (runner_up, _) = scores[0], scores[1]
+    return agent if best - runner_up >= _SIMILARITY_MIN_GAP else None
+
+
+@lru_cache(maxsize=4096)
+def _keyword_agents(query: str) -> tuple:
+    """
+    Agents with at least one keyword in a lowercased query, most matches
+    first; ties keep AGENT_KEYWORDS order
+    """
+    # Count keyword matches per agent; keywords shared by several agents
+    # ("study") are held back until the unambiguous ones are counted
+    matches = dict.fromkeys(AGENT_KEYWORDS, 0)
+    ambiguous = []
+    for kw, agents in _KEYWORD_AGENTS:
+        if kw in query:
+            if len(agents) == 1:
+                matches[agents[0]] += 1
+            else:
+                ambiguous.append(agents)
     
-    # Count keyword matches
-    clinical_match = sum(1 for kw in clinical_keywords if kw in query)
-    patent_match = sum(1 for kw in patent_keywords if kw in query)
-    regulatory_match = sum(1 for kw in regulatory_keywords if kw in query)
-    journal_match = sum(1 for kw in journal_keywords if kw in query)
+    # An ambiguous keyword reinforces the agents it names that already
+    # matched on their own, or else counts only for the first of them, so
+    # it never fans a query out to an extra agent by itself
+    for agents in ambiguous:
+        supported = [agent for agent in agents if matches[agent]]
+        for agent in supported or agents[:1]:
+            matches[agent] += 1
     
-    # Return agent with highest match count
-    matches = {
-        "clinical_trials": clinical_match,
-        "patent": patent_match,
-        "regulatory": regulatory_match,
-        "scientific_journal": journal_match
-    }
+    return tuple(sorted((agent for agent in matches if matches[agent]), key=matches.get, reverse=True))
+
+
+@lru_cache(maxsize=4096)
+def _route_local(query: str):
+    """
+    Deterministic part of routing for a lowercased query, memoized: keyword
+    counts, then the similarity fallback. Returns None when the LLM has to
+    decide, so that (non-deterministic) answer is never cached here.
+    """
+    agents = _keyword_agents(query)
     
     # Get the agent with max matches (default to clinical_trials if tie)
-    best_agent = max(matches, key=matches.get)
-    
-    # If no clear match, use LLM to decide
-    if max(matches.values()) == 0:
-        routing_prompt = f"""Based on this query, which pharmaceutical research expert should handle it?
+    return agents[0] if agents else _closest_agent(query)
+
+
+def _routing_messages(query: str) -> list:
+    """LLM prompt asking which agent should handle a lowercased query"""
+    routing_prompt = f"""Based on this query, which pharmaceutical research expert should handle it?
         
 Query: {query}
 
@@ -55,28 +119,66 @@ Choose one:
 - scientific_journal: For published research, scientific literature
 
 Respond with only the agent name (e.g., 'clinical_trials')"""
-        
-        response = llm.invoke([SystemMessage(content=routing_prompt)])
-        response_text = response.content.lower()
-        
-        if "patent" in response_text:
-            return "patent"
-        elif "regulatory" in response_text:
-            return "regulatory"
-        elif "scientific" in response_text or "journal" in response_text:
-            return "scientific_journal"
-        else:
-            return "clinical_trials"
+    return [SystemMessage(content=routing_prompt)]
+
+
+def _parse_routing_response(response_text: str) -> str:
+    """Map the LLM's routing answer to an agent (clinical_trials by default)"""
+    response_text = response_text.lower()
+    if "patent" in response_text:
+        return "patent"
+    elif "regulatory" in response_text:
+        return "regulatory"
+    elif "scientific" in response_text or "journal" in response_text:
+        return "scientific_journal"
+    else:
+        return "clinical_trials"
+
+
+def route_query(state: State) -> str:
+    """
+    Router function that determines which agent(s) should handle the query
+    Returns the next node in the graph to execute
+    """
+    messages = state.get("message", [])
+    
+    # Get the last user message
+    if not messages:
+        return "clinical_trials"  # Default agent
+    
+    last_message = messages[-1]
+    query = last_message.content.lower()
+    
+    best_agent = _route_local(query)
+    
+    # If no clear match locally, use LLM to decide
+    if best_agent is None:
+        # Imported here so keyword/similarity routing never loads the model
+        from services.llm_service import llm
+        response = llm.invoke(_routing_messages(query))
+        return _parse_routing_response(response.content)
     
     return best_agent
 
 
-def should_synthesize(state: State) -> bool:
+def route_queries(queries: List[str]) -> List[str]:
     """
-    Determines if responses should be synthesized
-    Returns True if multiple agents have contributed
+    Route several queries at once, in order. Queries the local router
+    cannot decide go to the LLM together in one concurrent `llm.batch`
+    call (each distinct query once) instead of one round-trip each.
     """
-    messages = state.get("message", [])
-    # Count AIMessage occurrences - if more than one agent has responded, synthesize
-    ai_message_count = sum(1 for msg in messages if hasattr(msg, '__class__') and msg.__class__.__name__ == 'AIMessage')
-    return ai_message_count > 1
+    lowered = [query.lower() for query in queries]
+    routes = [_route_local(query) for query in lowered]
+    
+    undecided = list(dict.fromkeys(q for q, route in zip(lowered, routes) if route is None))
+    if undecided:
+        # Imported here so keyword/similarity routing never loads the model
+        from services.llm_service import llm
+        responses = llm.batch([_routing_messages(q) for q in undecided])
+        llm_routes = {
+            q: _parse_routing_response(response.content)
+            for q, response in zip(undecided, responses)
+        }
+        routes = [route or llm_routes[q] for q, route in zip(lowered, routes)]
+    
+    return routes
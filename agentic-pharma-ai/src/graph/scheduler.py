@@ -0,0 +1,87 @@
+"""
+Rank-based scheduler for the orchestrator's agent graph.
+
+Agents are grouped by their def-use rank: agents in the same rank have no
+data dependency on each other and run concurrently, and a rank only starts
+once every agent in the previous rank has finished. Wall-clock latency is
+therefore the slowest agent per rank rather than the sum over all agents.
+"""
+import asyncio
+from itertools import groupby
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional
+
+if TYPE_CHECKING:  # only needed for hints
+    from graph.state import State
+
+
+# The four specialists only read the user query (rank 0); the summarizer
+# consumes all of their responses (rank 1)
+AGENT_RANKS = {
+    "clinical_trials": 0,
+    "patent": 0,
+    "regulatory": 0,
+    "scientific_journal": 0,
+    "summarizer": 1,
+}
+
+
+# Synthesis only adds value over at least two real specialist answers
+MIN_RESPONSES_TO_SYNTHESIZE = 2
+
+
+def is_agent_answer(message) -> bool:
+    """Whether a message is a real agent answer, not an error placeholder"""
+    return getattr(message, "type", None) == "ai" and not message.response_metadata.get("agent_error")
+
+
+def successful_responses(messages: list) -> int:
+    """Count AI messages that are real agent answers, not error placeholders"""
+    return sum(1 for m in messages if is_agent_answer(m))
+
+
+def plan_ranks(agent_keys: List[str]) -> List[List[str]]:
+    """
+    Group agents into execution ranks
+    
+    Args:
+        agent_keys: Specialist agents selected by the planner
+        
+    Returns:
+        List of ranks, each a list of agent keys that may run concurrently
+    """
+    keys = list(agent_keys)
+    # Synthesis is only needed when more than one specialist responds
+    if len(keys) > 1:
+        keys.append("summarizer")
+    ordered = sorted(keys, key=AGENT_RANKS.__getitem__)
+    return [list(group) for _, group in groupby(ordered, key=AGENT_RANKS.__getitem__)]
+
+
+async def schedule(
+    state: "State",
+    agent_keys: List[str],
+    run_agent: Callable[[str, "State"], Awaitable[Optional[object]]],
+) -> "State":
+    """
+    Execute the agent graph rank by rank
+    
+    Args:
+        state: Initial orchestrator state
+        agent_keys: Specialist agents selected by the planner
+        run_agent: Coroutine returning the message an agent produced (or None)
+        
+    Returns:
+        State with every agent's message merged into `message` and
+        `synthesized` set when the summarizer produced its answer; the
+        summarizer rank is skipped when fewer than
+        MIN_RESPONSES_TO_SYNTHESIZE specialists succeeded
+    """
+    for rank in plan_ranks(agent_keys):
+        if rank == ["summarizer"] and successful_responses(state["message"]) < MIN_RESPONSES_TO_SYNTHESIZE:
+            break
+        responses = await asyncio.gather(*(run_agent(key, state) for key in rank))
+        state["message"] = state["message"] + [r for r in responses if r is not None]
+        if rank == ["summarizer"]:
+            # A failed summarizer returns no message; keep the flag honest
+            state["synthesized"] = responses[0] is not None
+    return state
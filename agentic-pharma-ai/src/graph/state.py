@@ -5,9 +5,11 @@ from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 
 
 class State(TypedDict):
-    system_prompt: Annotated[str, "The master orchestrator system prompt."]
-    clinical_trials_prompt: Annotated[str, "System prompt for clinical trials agent."]
-    patent_prompt: Annotated[str, "System prompt for patent agent."]
-    regulator_prompt: Annotated[str, "System prompt for regulatory agent."]
-    scientific_journal_prompt: Annotated[str, "System prompt for scientific journal agent."]
-    message : Annotated[list[HumanMessage | AIMessage], "The list of messages exchanged so far."]
\ No newline at end of file
+    # System prompts are constants; each agent reads its own from
+    # prompts.system_prompts rather than carrying them in the state
+    # Formatted data context per agent key, fetched once by the orchestrator
+    # before the agents run; agents fall back to their data tool when absent
+    prefetch: Annotated[dict[str, str], "Prefetched data context per agent."]
+    message : Annotated[list[HumanMessage | AIMessage], "The list of messages exchanged so far."]
+    # Set by the scheduler once the summarizer has produced the final answer
+    synthesized: Annotated[bool, "Whether the summarizer's synthesis is in `message`."]
\ No newline at end of file
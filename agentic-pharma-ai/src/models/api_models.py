@@ -1,14 +1,16 @@
 """
 Request and Response models for the Orchestrator API
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional, List, Dict, Any
+from datetime import datetime, timezone
 
 
 class QueryRequest(BaseModel):
     """Request model for pharmaceutical research queries"""
-    query: str = Field(..., description="The pharmaceutical research question")
+    query: Annotated[str, StringConstraints(strip_whitespace=True, min_length=3)] = Field(
+        ..., description="The pharmaceutical research question (at least 3 characters)"
+    )
     max_agents: Optional[int] = Field(default=5, description="Maximum number of agents to use")
     
     class Config:
@@ -18,12 +20,22 @@ class QueryRequest(BaseModel):
         }
 
 
+class BatchQueryRequest(BaseModel):
+    """Request model for querying all data tools at once"""
+    query: str = Field(..., description="Search query sent to every data tool")
+    
+    class Config:
+        example = {
+            "query": "DTZ-100"
+        }
+
+
 class AgentResponse(BaseModel):
     """Response from a single agent"""
     agent_name: str = Field(..., description="Name of the agent (clinical_trials, patent, etc)")
     response: str = Field(..., description="The agent's analysis and response")
     data_found: bool = Field(..., description="Whether relevant data was found")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(..., description="Request timestamp, captured once by the caller and shared by every response it builds")
     
     class Config:
         example = {
@@ -42,7 +54,7 @@ class OrchestratorResponse(BaseModel):
     agent_count: int = Field(..., description="Number of agents consulted")
     total_messages: int = Field(..., description="Total messages in conversation")
     synthesis_performed: bool = Field(..., description="Whether synthesis was performed")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(..., description="Request timestamp, captured once by the caller")
     
     class Config:
         example = {
@@ -59,7 +71,7 @@ class OrchestratorResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str = Field(..., description="Health status")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     version: str = Field(default="1.0.0")
     
     class Config:
@@ -74,7 +86,7 @@ class ErrorResponse(BaseModel):
     """Error response model"""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(default=None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     class Config:
         example = {
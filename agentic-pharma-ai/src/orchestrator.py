@@ -1,26 +1,31 @@
 """Orchestrator initialization and execution module.
 
 This orchestrator performs simple planning to determine which specialist
-agents should run for a given user query, invokes those agents sequentially,
-and then synthesizes their outputs into a single final response.
+agents should run for a given user query, invokes those agents concurrently
+(on threads via `run_orchestrator`, or as coroutines via
+`run_orchestrator_async` and `stream_orchestrator`), and then synthesizes
+their outputs into a single final response.
 """
-from typing import List
-
-from langchain_core.messages import HumanMessage
-from graph.state import State
-from prompts.system_prompts import (
-    ORCHESTRATOR_PROMPT,
-    CLINICAL_TRIALS_PROMPT,
-    PATENT_PROMPT,
-    REGULATORY_PROMPT,
-    SCIENTIFIC_JOURNAL_PROMPT,
-    SUMMARIZER_PROMPT,
-)
+import asyncio
+import importlib
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
+
+from graph.scheduler import MIN_RESPONSES_TO_SYNTHESIZE, is_agent_answer, plan_ranks, schedule, successful_responses
+from tools.prefetch import data_prefetch_node
+
+if TYPE_CHECKING:  # only needed for hints
+    from graph.state import State
 
 
-def initialize_state(user_query: str) -> State:
+def initialize_state(user_query: str) -> "State":
     """
-    Initialize the state with system prompts and the initial user query
+    Initialize the state with the initial user query (agents read their
+    system prompts from `prompts.system_prompts` directly)
     
     Args:
         user_query: The user's initial question or request
@@ -28,58 +33,181 @@ def initialize_state(user_query: str) -> State:
     Returns:
         Initialized State dictionary
     """
+    from langchain_core.messages import HumanMessage
     return {
-        "system_prompt": ORCHESTRATOR_PROMPT,
-        "clinical_trials_prompt": CLINICAL_TRIALS_PROMPT,
-        "patent_prompt": PATENT_PROMPT,
-        "regulator_prompt": REGULATORY_PROMPT,
-        "scientific_journal_prompt": SCIENTIFIC_JOURNAL_PROMPT,
-        "message": [HumanMessage(content=user_query)]
+        "message": [HumanMessage(content=user_query)],
+        "synthesized": False
     }
 
 
+# Planner keywords per agent; dict order is the order agents are returned in
+PLAN_KEYWORDS = {
+    "clinical_trials": ("clinical trial", "nct", "study", "patient", "efficacy", "phase"),
+    "patent": ("patent", "intellectual property", "ip", "formulation", "chemical"),
+    "regulatory": ("fda", "approval", "compliance", "safety", "regulatory", "nda", "bla", "ind"),
+    "scientific_journal": ("journal", "research", "published", "paper", "study", "literature", "immunotherapy", "nature"),
+}
+
+# One bit per agent, in PLAN_KEYWORDS order, so matches accumulate into an
+# int and a precomputed table maps the final mask back to agent keys
+_PLAN_AGENT_BITS = {agent: 1 << i for i, agent in enumerate(PLAN_KEYWORDS)}
+_PLAN_ALL_AGENTS = (1 << len(PLAN_KEYWORDS)) - 1
+_PLAN_MASK_AGENTS = tuple(
+    tuple(agent for agent, bit in _PLAN_AGENT_BITS.items() if mask & bit)
+    for mask in range(_PLAN_ALL_AGENTS + 1)
+)
+
+# Each distinct keyword with the bits of the agents it may select. A
+# keyword listed under several agents ("study") is ambiguous: see
+# _resolve_ambiguous
+_PLAN_KEYWORD_BITS = {}
+for _agent, _keywords in PLAN_KEYWORDS.items():
+    for _kw in _keywords:
+        _PLAN_KEYWORD_BITS[_kw] = _PLAN_KEYWORD_BITS.get(_kw, 0) | _PLAN_AGENT_BITS[_agent]
+
+
+def _resolve_ambiguous(mask: int, ambiguous: list) -> int:
+    """
+    Route each ambiguous keyword match to one agent: nothing new when one
+    of its agents already matched a keyword of its own, else the first of
+    them in PLAN_KEYWORDS order ("cancer study" runs clinical_trials only)
+    """
+    for bits in ambiguous:
+        if not mask & bits:
+            mask |= bits & -bits
+    return mask
+
+
+def _matched_plan_mask(q: str) -> int:
+    """Bitmask of the agents selected by the keywords in the lowercased query"""
+    mask = 0
+    ambiguous = []
+    for kw, bits in _PLAN_KEYWORD_BITS.items():
+        if kw in q:
+            # More than one bit set: a keyword shared by several agents
+            if bits & (bits - 1):
+                ambiguous.append(bits)
+            else:
+                mask |= bits
+                # Every agent is already selected; later keywords add nothing
+                if mask == _PLAN_ALL_AGENTS:
+                    return mask
+    return _resolve_ambiguous(mask, ambiguous)
+
+
+@lru_cache(maxsize=4096)
+def _plan_lowered(q: str) -> tuple:
+    """Planner result for a lowercased query, memoized (the planner is pure)"""
+    mask = _matched_plan_mask(q)
+
+    # If user explicitly asks to compare or all domains, include all
+    if ("compare" in q or "all" in q or "across" in q) and mask != _PLAN_ALL_AGENTS:
+        return _PLAN_MASK_AGENTS[_PLAN_ALL_AGENTS]
+
+    # Default to clinical_trials if nothing matched
+    return _PLAN_MASK_AGENTS[mask] or ("clinical_trials",)
+
+
 def plan_agents(query: str) -> List[str]:
     """
     Simple planner: choose which agents should handle the query.
     Returns a list of agent keys (matching module names):
     `clinical_trials`, `patent`, `regulatory`, `scientific_journal`.
     """
-    q = query.lower()
-    agents = []
-
-    # keywords
-    if any(k in q for k in ["clinical trial", "nct", "study", "patient", "efficacy", "phase"]):
-        agents.append("clinical_trials")
-    if any(k in q for k in ["patent", "intellectual property", "ip", "formulation", "chemical"]):
-        agents.append("patent")
-    if any(k in q for k in ["fda", "approval", "compliance", "safety", "regulatory", "nda", "bla", "ind"]):
-        agents.append("regulatory")
-    if any(k in q for k in ["journal", "research", "published", "paper", "study", "literature", "immunotherapy", "nature"]):
-        agents.append("scientific_journal")
+    return list(_plan_lowered(query.lower()))
 
-    # If user explicitly asks to compare or all domains, include all
-    if ("compare" in q or "all" in q or "across" in q) and len(agents) < 4:
-        return ["clinical_trials", "patent", "regulatory", "scientific_journal"]
 
-    # Default to clinical_trials if nothing matched
-    return agents or ["clinical_trials"]
+# agent key -> (module, sync callable, async callable, streaming callable)
+_AGENT_PATHS = {
+    "clinical_trials": ("agents.clinical_trials_agent", "clinical_trials_agent", "aclinical_trials_agent", "astream_clinical_trials_agent"),
+    "patent": ("agents.patent_agent", "patent_agent", "apatent_agent", "astream_patent_agent"),
+    "regulatory": ("agents.regulator_agent", "regulatory_agent", "aregulatory_agent", "astream_regulatory_agent"),
+    "scientific_journal": ("agents.scientific_journal_agent", "scientific_journal_agent", "ascientific_journal_agent", "astream_scientific_journal_agent"),
+    "summarizer": ("agents.summarizer_agent", "summarizer_agent", "asummarizer_agent", "astream_summarizer_agent"),
+}
+
+# (agent key, variant) -> callable, filled on first use so each agent module
+# is imported once and later lookups skip the import machinery
+_AGENT_REGISTRY = {}
+
+
+def _resolve_agent(agent_key: str, variant: int):
+    """Return the agent callable for a variant (1 sync, 2 async, 3 streaming), importing it on first use."""
+    fn = _AGENT_REGISTRY.get((agent_key, variant))
+    if fn is None:
+        if agent_key not in _AGENT_PATHS:
+            raise ValueError(f"Unknown agent: {agent_key}")
+        path = _AGENT_PATHS[agent_key]
+        fn = getattr(importlib.import_module(path[0]), path[variant])
+        _AGENT_REGISTRY[(agent_key, variant)] = fn
+    return fn
 
 
 def _import_agent(agent_key: str):
     """Dynamically import agent callable by key."""
-    if agent_key == "clinical_trials":
-        from agents.clinical_trials_agent import clinical_trials_agent as fn
-    elif agent_key == "patent":
-        from agents.patent_agent import patent_agent as fn
-    elif agent_key == "regulatory":
-        from agents.regulator_agent import regulatory_agent as fn
-    elif agent_key == "scientific_journal":
-        from agents.scientific_journal_agent import scientific_journal_agent as fn
-    elif agent_key == "summarizer":
-        from agents.summarizer_agent import summarizer_agent as fn
-    else:
-        raise ValueError(f"Unknown agent: {agent_key}")
-    return fn
+    return _resolve_agent(agent_key, 1)
+
+
+def _import_async_agent(agent_key: str):
+    """Dynamically import the async (coroutine) agent callable by key."""
+    return _resolve_agent(agent_key, 2)
+
+
+def _import_stream_agent(agent_key: str):
+    """Dynamically import the streaming (async generator) agent callable by key."""
+    return _resolve_agent(agent_key, 3)
+
+
+# Attempts per agent call. The OpenAI client already retries transport
+# errors internally; this covers failures that escape it (e.g. a rate limit
+# outlasting its backoff) once more before the agent is reported as failed
+AGENT_MAX_ATTEMPTS = int(os.getenv("AGENT_MAX_ATTEMPTS", "2"))
+_RETRY_BASE_DELAY_SEC = 0.5
+
+# Transient failures worth another attempt, matched by class name so the
+# provider SDK is not imported here; anything else fails the agent at once
+_RETRYABLE_ERRORS = frozenset({
+    "TimeoutError", "ConnectionError",
+    "APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError",
+})
+
+
+def _is_retryable(err: Exception) -> bool:
+    """Whether an agent error is transient (timeouts, dropped connections, 429/5xx)"""
+    return any(cls.__name__ in _RETRYABLE_ERRORS for cls in type(err).__mro__)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (0-based) failed attempt"""
+    return random.uniform(0, _RETRY_BASE_DELAY_SEC * 2 ** attempt)
+
+
+def _agent_failure(agent_key: str, err: Exception):
+    """Placeholder message for an agent that gave up (None for the summarizer)"""
+    from langchain_core.messages import AIMessage
+    # A failed synthesis leaves the specialist responses as the final answer
+    if agent_key == "summarizer":
+        return None
+    # Flagged so the scheduler does not count it towards synthesis
+    return AIMessage(content=f"Agent {agent_key} error: {err}", response_metadata={"agent_error": True})
+
+
+def _run_agent_sync(agent_key: str, state: "State"):
+    """Run one sync agent and return the AIMessage it produced (or an error placeholder)."""
+    agent_fn = _import_agent(agent_key)
+    for attempt in range(AGENT_MAX_ATTEMPTS):
+        try:
+            result = agent_fn(state)
+            break
+        except Exception as e:
+            if attempt + 1 < AGENT_MAX_ATTEMPTS and _is_retryable(e):
+                time.sleep(_retry_delay(attempt))
+                continue
+            return _agent_failure(agent_key, e)
+
+    if isinstance(result, dict) and result.get("message"):
+        return result["message"][-1]
+    return None
 
 
 def run_orchestrator(user_query: str) -> dict:
@@ -89,45 +217,125 @@ def run_orchestrator(user_query: str) -> dict:
     Steps:
     1. Initialize state
     2. Plan which agents to run
-    3. Invoke each agent sequentially, updating state
-    4. If multiple agents produced responses, run `summarizer` to synthesize
+    3. Invoke the agents rank by rank (see `graph.scheduler`): the
+       specialists concurrently on worker threads, since each is an
+       independent blocking LLM call, then their messages are merged
+    4. If at least two agents answered successfully, run `summarizer` to
+       synthesize; transient agent errors are retried first (see
+       `AGENT_MAX_ATTEMPTS`)
     """
     state = initialize_state(user_query)
 
     # Decide which agents to run
     agent_keys = plan_agents(user_query)
 
-    # Run each agent sequentially
-    for key in agent_keys:
-        agent_fn = _import_agent(key)
+    # Agents only read the state, so a rank shares it; the merged messages
+    # are written back before the next rank starts
+    with ThreadPoolExecutor(max_workers=len(agent_keys)) as pool:
+        for rank in plan_ranks(agent_keys):
+            if rank == ["summarizer"] and successful_responses(state["message"]) < MIN_RESPONSES_TO_SYNTHESIZE:
+                break
+            responses = list(pool.map(lambda key: _run_agent_sync(key, state), rank))
+            state["message"] = state["message"] + [r for r in responses if r is not None]
+            if rank == ["summarizer"]:
+                state["synthesized"] = responses[0] is not None
+
+    return state
+
+
+async def _run_agent_async(agent_key: str, state: "State"):
+    """Run one async agent and return the AIMessage it appended (or an error placeholder)."""
+    agent_fn = _import_async_agent(agent_key)
+    for attempt in range(AGENT_MAX_ATTEMPTS):
         try:
-            result = agent_fn(state)
+            result = await agent_fn(state)
+            break
         except Exception as e:
-            # Attach an error AIMessage-like placeholder
-            from langchain_core.messages import AIMessage
-            messages = state.get("message", [])
-            messages.append(AIMessage(content=f"Agent {key} error: {e}"))
-            state["message"] = messages
-            continue
-
-        # Expect agent result to contain an updated 'message' list
-        if isinstance(result, dict) and result.get("message"):
-            state["message"] = result["message"]
-
-    # If more than one agent ran, synthesize
-    if len(agent_keys) > 1:
-        summarizer = _import_agent("summarizer")
+            if attempt + 1 < AGENT_MAX_ATTEMPTS and _is_retryable(e):
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            return _agent_failure(agent_key, e)
+
+    if isinstance(result, dict) and result.get("message"):
+        return result["message"][-1]
+    return None
+
+
+async def run_orchestrator_async(user_query: str) -> dict:
+    """
+    Async counterpart of `run_orchestrator`.
+
+    Execution is delegated to the rank-based scheduler in `graph.scheduler`:
+    the planned agents' data lookups are prefetched in one concurrent batch,
+    the specialist agents are independent of each other and run
+    concurrently, then the summarizer runs once on their merged responses
+    when at least two of them succeeded.
+    """
+    state = initialize_state(user_query)
+
+    # Decide which agents to run
+    agent_keys = plan_agents(user_query)
+
+    # Fetch every planned agent's data in one concurrent batch
+    state["prefetch"] = await data_prefetch_node(user_query, agent_keys)
+
+    return await schedule(state, agent_keys, _run_agent_async)
+
+
+async def stream_orchestrator(user_query: str):
+    """
+    Stream the orchestrator's output as it is generated.
+
+    Yields `(agent_key, text)` pairs. The planned agents stream concurrently,
+    so their chunks are interleaved; once they all finish, the summarizer's
+    chunks follow under the `summarizer` key when at least two agents
+    streamed without error.
+    """
+    from langchain_core.messages import AIMessage
+    state = initialize_state(user_query)
+
+    # Decide which agents to run
+    agent_keys = plan_agents(user_query)
+    state["prefetch"] = await data_prefetch_node(user_query, agent_keys)
+
+    queue = asyncio.Queue()
+    collected = {key: "" for key in agent_keys}
+    failed = set()
+
+    async def pump(key: str):
         try:
-            result = summarizer(state)
-            if isinstance(result, dict) and result.get("message"):
-                state["message"] = result["message"]
-        except Exception:
-            pass
+            async for chunk in _import_stream_agent(key)(state):
+                await queue.put((key, chunk.content))
+        except Exception as e:
+            failed.add(key)
+            await queue.put((key, f"Agent {key} error: {e}"))
+        finally:
+            await queue.put((key, None))
 
-    return state
+    tasks = [asyncio.create_task(pump(key)) for key in agent_keys]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            key, text = await queue.get()
+            if text is None:
+                remaining -= 1
+                continue
+            collected[key] += text
+            yield key, text
+    finally:
+        for task in tasks:
+            task.cancel()
 
+    # If enough agents answered, stream the synthesis
+    if len(agent_keys) - len(failed) >= MIN_RESPONSES_TO_SYNTHESIZE:
+        state["message"] = state["message"] + [
+            AIMessage(content=collected[key]) for key in agent_keys
+        ]
+        async for chunk in _import_stream_agent("summarizer")(state):
+            yield "summarizer", chunk.content
 
-def format_response(final_state: State) -> str:
+
+def format_response(final_state: "State") -> str:
     """
     Format the final state into a readable response
     
@@ -135,17 +343,25 @@ def format_response(final_state: State) -> str:
         final_state: The final state returned from orchestrator
         
     Returns:
-        Formatted response string
+        Formatted response string: the summarizer's synthesis when it ran,
+        otherwise the successful specialist answers
     """
     messages = final_state.get("message", [])
     
     if not messages:
         return "No response generated"
     
-    # Get the last message (final response)
-    last_message = messages[-1]
+    # The synthesis is the last message
+    if final_state.get("synthesized"):
+        return messages[-1].content
+    
+    # Without one, the last message may be a failed agent's error
+    # placeholder; answer with the specialists that succeeded instead
+    answers = [m.content for m in messages if is_agent_answer(m)]
+    if answers:
+        return "\n\n".join(answers)
     
-    return last_message.content
+    return messages[-1].content
 
 
 if __name__ == "__main__":
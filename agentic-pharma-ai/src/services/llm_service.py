@@ -1,19 +1,133 @@
-# placeholder
-from langchain_openai import ChatOpenAI
+from langchain_core.caches import BaseCache
+import hashlib
+import httpx
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
-llm = ChatOpenAI(model="gpt-5-nano",
-    stream_usage=True,
-    temperature=0,
-    # max_tokens=None,
-    # timeout=None,
-    # reasoning_effort="low",
-    # max_retries=2,
-    api_key=os.getenv("OPEN_API_KEY"),  # If you prefer to pass api key in directly
-    # base_url="...",
-    # organization="...",
-    # other params...
+
+class LLMResponseCache(BaseCache):
+    """
+    In-process TTL + LRU cache for LLM responses.
+
+    The model runs with temperature=0, so identical (model config, messages)
+    pairs produce the same answer; repeated agent invocations are served from
+    memory instead of re-calling the provider. Entries are keyed on a sha256
+    of the serialized model config and message chain.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        payload = json.dumps({"model": llm_string, "messages": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str):
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, return_val)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, **kwargs) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # In-memory lookups are cheap; skip the default thread-pool hop
+    async def alookup(self, prompt: str, llm_string: str):
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs) -> None:
+        self.clear(**kwargs)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
+
+
+response_cache = LLMResponseCache(
+    maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "1024")),
+    ttl=float(os.getenv("LLM_CACHE_TTL", "3600")),
+)
+
+# Upper bound for one orchestrated query; also the HTTP timeout so sockets
+# are closed rather than left hanging when the provider stalls
+LLM_TIMEOUT_SEC = float(os.getenv("LLM_TIMEOUT_SEC", "60"))
+
+# One process-wide async HTTP client so every agent's ainvoke reuses pooled
+# keep-alive connections (and their TLS sessions) to the LLM endpoint
+http_async_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=LLM_TIMEOUT_SEC,
 )
+
+# The chat model (and the langchain_openai import behind it) is built on
+# first use, so importing this module for the cache or HTTP client is cheap
+@lru_cache(maxsize=1)
+def get_llm():
+    """Return the shared chat model, building it on the first call"""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model="gpt-5-nano",
+        stream_usage=True,
+        temperature=0,
+        # max_tokens=None,
+        # timeout=None,
+        # reasoning_effort="low",
+        # max_retries=2,
+        api_key=os.getenv("OPEN_API_KEY"),  # If you prefer to pass api key in directly
+        cache=response_cache,
+        http_async_client=http_async_client,
+        # base_url="...",
+        # organization="...",
+        # other params...
+    )
+
+
+def __getattr__(name):
+    # `from services.llm_service import llm` keeps working and builds the
+    # model at that point
+    if name == "llm":
+        return get_llm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
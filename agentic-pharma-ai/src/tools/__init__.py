@@ -1 +1,66 @@
-# placeholder
+"""Helpers shared by the data tools over their static databases"""
+from functools import wraps
+from typing import Callable, Dict, Iterable, List
+
+import orjson
+
+# Separator between a record's fields in its search blob. No field contains
+# it, so a query without it can only match inside a single field
+SEARCH_FIELD_SEP = "\0"
+
+
+def search_blob(fields: Iterable[str]) -> str:
+    """Join a record's searchable fields into one blob for substring search"""
+    return SEARCH_FIELD_SEP.join(fields)
+
+
+def matching_keys(query_lower: str, blobs: Dict[str, str]) -> List[str]:
+    """
+    Keys of the records whose search blob contains the lowercased query,
+    i.e. that have some single field containing it
+
+    A query holding the separator (e.g. `?query=%00`) could only match
+    across a field boundary, so it matches nothing.
+    """
+    if SEARCH_FIELD_SEP in query_lower:
+        return []
+    return [key for key, blob in blobs.items() if query_lower in blob]
+
+
+def precomputed_formatter(db: Dict[str, Dict], build: Callable[[Dict], str]) -> Callable[[Dict], str]:
+    """
+    Build the LLM text of every database row once and return a formatter
+    that serves it
+
+    Texts are keyed by the row's database key. Rows do not all carry their
+    key (trials have no NCT field), so a row is resolved to its key by
+    identity; copies and other dicts are formatted by `build`.
+    """
+    texts = {key: build(row) for key, row in db.items()}
+    keys = {id(row): key for key, row in db.items()}
+
+    def format_row(row: Dict) -> str:
+        key = keys.get(id(row))
+        if key is not None and db.get(key) is row:
+            return texts[key]
+        return build(row)
+
+    return format_row
+
+
+def copied_results(fn: Callable[..., Dict]) -> Callable[..., Dict]:
+    """
+    Serve a data tool's results as copies
+
+    `fn`'s results share the database rows (and, when it is lru_cached, the
+    cached dict itself), so every call returns an orjson round-trip of the
+    result that callers can mutate freely, as database._memoized does. The
+    wrapper's .shared is `fn` itself, for read-only internal callers that
+    need the rows by identity (see precomputed_formatter).
+    """
+    @wraps(fn)
+    def copy(*args, **kwargs) -> Dict:
+        return orjson.loads(orjson.dumps(fn(*args, **kwargs)))
+
+    copy.shared = fn
+    return copy
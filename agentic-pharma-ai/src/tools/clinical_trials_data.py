@@ -3,8 +3,11 @@ Clinical Trials Data Tool
 Retrieves clinical trial data from dummy database
 """
 import json
+from functools import lru_cache
 from typing import Optional, List, Dict
 
+from tools import copied_results, matching_keys, precomputed_formatter, search_blob
+
 
 # Dummy Clinical Trials Database
 CLINICAL_TRIALS_DB = {
@@ -63,7 +66,26 @@ CLINICAL_TRIALS_DB = {
     }
 }
 
+# Lowercased searchable fields per trial, built once: the database is
+# static, so searches compare against these instead of lowering every
+# row's fields on every call
+_TRIAL_SEARCH_FIELDS = {
+    nct_number: (
+        trial_data.get("drug_name", "").lower(),
+        trial_data.get("phase", "").lower(),
+        trial_data.get("title", "").lower(),
+    )
+    for nct_number, trial_data in CLINICAL_TRIALS_DB.items()
+}
+
+# The same fields as one blob per trial (see tools.search_blob)
+_TRIAL_SEARCH_TEXT = {
+    nct_number: search_blob(fields) for nct_number, fields in _TRIAL_SEARCH_FIELDS.items()
+}
 
+
+@copied_results
+@lru_cache(maxsize=512)
 def get_clinical_trial_data(query: str) -> Dict:
     """
     Retrieves clinical trial data from dummy database
@@ -72,7 +94,7 @@ def get_clinical_trial_data(query: str) -> Dict:
         query: Search query (drug name, NCT number, or trial phase)
         
     Returns:
-        Dictionary with matching trial data
+        Dictionary with matching trial data (memoized per query; each call returns a copy)
     """
     query_lower = query.lower()
     results = {}
@@ -85,11 +107,8 @@ def get_clinical_trial_data(query: str) -> Dict:
             return {"found": False, "message": f"NCT {query} not found"}
     
     # Search by drug name or phase
-    for nct_number, trial_data in CLINICAL_TRIALS_DB.items():
-        if (query_lower in trial_data.get("drug_name", "").lower() or
-            query_lower in trial_data.get("phase", "").lower() or
-            query_lower in trial_data.get("title", "").lower()):
-            results[nct_number] = trial_data
+    for nct_number in matching_keys(query_lower, _TRIAL_SEARCH_TEXT):
+        results[nct_number] = CLINICAL_TRIALS_DB[nct_number]
     
     if results:
         return {"found": True, "trials": list(results.values()), "count": len(results)}
@@ -97,12 +116,14 @@ def get_clinical_trial_data(query: str) -> Dict:
         return {"found": False, "message": f"No trials found for '{query}'"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_all_clinical_trials() -> Dict:
     """
     Retrieves all clinical trials from dummy database
     
     Returns:
-        Dictionary with all trials
+        Dictionary with all trials (memoized; each call returns a copy)
     """
     return {
         "found": True,
@@ -111,6 +132,7 @@ def get_all_clinical_trials() -> Dict:
     }
 
 
+@copied_results
 def get_trial_by_phase(phase: str) -> Dict:
     """
     Get clinical trials by phase
@@ -119,14 +141,14 @@ def get_trial_by_phase(phase: str) -> Dict:
         phase: Trial phase (Phase 1, Phase 2, Phase 3, Phase 4)
         
     Returns:
-        Dictionary with matching trials
+        Dictionary with matching trials (a copy per call)
     """
     phase_lower = phase.lower()
     results = {}
     
-    for nct_number, trial_data in CLINICAL_TRIALS_DB.items():
-        if phase_lower in trial_data.get("phase", "").lower():
-            results[nct_number] = trial_data
+    for nct_number, (_, trial_phase, _) in _TRIAL_SEARCH_FIELDS.items():
+        if phase_lower in trial_phase:
+            results[nct_number] = CLINICAL_TRIALS_DB[nct_number]
     
     if results:
         return {"found": True, "trials": list(results.values()), "count": len(results)}
@@ -134,16 +156,8 @@ def get_trial_by_phase(phase: str) -> Dict:
         return {"found": False, "message": f"No trials found for {phase}"}
 
 
-def format_trial_for_llm(trial_data: Dict) -> str:
-    """
-    Format trial data for LLM processing
-    
-    Args:
-        trial_data: Trial dictionary
-        
-    Returns:
-        Formatted string representation
-    """
+def _build_trial_for_llm(trial_data: Dict) -> str:
+    """Build the LLM text for one trial (see format_trial_for_llm)"""
     formatted = f"""
 CLINICAL TRIAL DATA:
 - Title: {trial_data.get('title', 'N/A')}
@@ -160,3 +174,20 @@ CLINICAL TRIAL DATA:
 - Sponsor: {trial_data.get('sponsor', 'N/A')}
 """
     return formatted
+
+
+# LLM text of every database row, built once at import
+_format_trial = precomputed_formatter(CLINICAL_TRIALS_DB, _build_trial_for_llm)
+
+
+def format_trial_for_llm(trial_data: Dict) -> str:
+    """
+    Format trial data for LLM processing
+    
+    Args:
+        trial_data: Trial dictionary
+        
+    Returns:
+        Formatted string representation (precomputed for database rows)
+    """
+    return _format_trial(trial_data)
@@ -3,8 +3,12 @@ Patent Data Tool
 Retrieves patent information from dummy database
 """
 import json
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional, List, Dict
 
+from tools import copied_results, matching_keys, precomputed_formatter, search_blob
+
 
 # Dummy Patent Database
 PATENTS_DB = {
@@ -90,7 +94,35 @@ PATENTS_DB = {
     }
 }
 
+# Lowercased searchable text per patent, built once: the database is
+# static, so searches compare against these instead of rebuilding
+# str(patent).lower() for every row on every call. Title, assignee and
+# the whole row form one blob per patent (see tools.search_blob)
+_PATENT_SEARCH_TEXT = {
+    patent_num: search_blob((
+        patent_data.get("title", ""),
+        patent_data.get("assignee", ""),
+        str(patent_data),
+    )).lower()
+    for patent_num, patent_data in PATENTS_DB.items()
+}
+
+# Patent numbers with status "Active"
+_ACTIVE_PATENT_NUMS = tuple(
+    patent_num for patent_num, patent_data in PATENTS_DB.items()
+    if patent_data.get("status") == "Active"
+)
+
+# Patents ordered by years_remaining (ties keep database order) with the
+# sorted key column alongside, so expiry windows are two bisections
+_PATENTS_BY_EXPIRY = tuple(sorted(
+    PATENTS_DB.values(), key=lambda patent_data: patent_data.get("years_remaining", 0)
+))
+_YEARS_REMAINING_SORTED = tuple(patent_data.get("years_remaining", 0) for patent_data in _PATENTS_BY_EXPIRY)
+
 
+@copied_results
+@lru_cache(maxsize=512)
 def get_patent_data(query: str) -> Dict:
     """
     Retrieves patent data from dummy database
@@ -99,7 +131,7 @@ def get_patent_data(query: str) -> Dict:
         query: Search query (patent number, drug name, or company)
         
     Returns:
-        Dictionary with matching patent data
+        Dictionary with matching patent data (memoized per query; each call returns a copy)
     """
     query_lower = query.lower()
     results = {}
@@ -112,11 +144,8 @@ def get_patent_data(query: str) -> Dict:
             return {"found": False, "message": f"Patent {query} not found"}
     
     # Search by title, drug name, or assignee
-    for patent_num, patent_data in PATENTS_DB.items():
-        if (query_lower in patent_data.get("title", "").lower() or
-            query_lower in patent_data.get("assignee", "").lower() or
-            query_lower in str(patent_data).lower()):
-            results[patent_num] = patent_data
+    for patent_num in matching_keys(query_lower, _PATENT_SEARCH_TEXT):
+        results[patent_num] = PATENTS_DB[patent_num]
     
     if results:
         return {"found": True, "patents": list(results.values()), "count": len(results)}
@@ -124,12 +153,14 @@ def get_patent_data(query: str) -> Dict:
         return {"found": False, "message": f"No patents found for '{query}'"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_all_patents() -> Dict:
     """
     Retrieves all patents from dummy database
     
     Returns:
-        Dictionary with all patents
+        Dictionary with all patents (memoized; each call returns a copy)
     """
     return {
         "found": True,
@@ -138,18 +169,15 @@ def get_all_patents() -> Dict:
     }
 
 
+@copied_results
 def get_active_patents() -> Dict:
     """
     Get all active patents
     
     Returns:
-        Dictionary with active patents
+        Dictionary with active patents (a copy per call)
     """
-    results = {}
-    
-    for patent_num, patent_data in PATENTS_DB.items():
-        if patent_data.get("status") == "Active":
-            results[patent_num] = patent_data
+    results = {patent_num: PATENTS_DB[patent_num] for patent_num in _ACTIVE_PATENT_NUMS}
     
     if results:
         return {"found": True, "patents": list(results.values()), "count": len(results)}
@@ -157,6 +185,7 @@ def get_active_patents() -> Dict:
         return {"found": False, "message": "No active patents found"}
 
 
+@copied_results
 def get_patents_expiring_soon(years: int = 5) -> Dict:
     """
     Get patents expiring within specified years
@@ -165,31 +194,21 @@ def get_patents_expiring_soon(years: int = 5) -> Dict:
         years: Number of years to look ahead
         
     Returns:
-        Dictionary with expiring patents
+        Dictionary with expiring patents, soonest expiry first (a copy per call)
     """
-    results = {}
-    
-    for patent_num, patent_data in PATENTS_DB.items():
-        years_remaining = patent_data.get("years_remaining", 0)
-        if 0 < years_remaining <= years:
-            results[patent_num] = patent_data
+    # Patents with 0 < years_remaining <= years
+    patents = list(_PATENTS_BY_EXPIRY[
+        bisect_right(_YEARS_REMAINING_SORTED, 0):bisect_right(_YEARS_REMAINING_SORTED, years)
+    ])
     
-    if results:
-        return {"found": True, "patents": list(results.values()), "count": len(results)}
+    if patents:
+        return {"found": True, "patents": patents, "count": len(patents)}
     else:
         return {"found": False, "message": f"No patents expiring within {years} years"}
 
 
-def format_patent_for_llm(patent_data: Dict) -> str:
-    """
-    Format patent data for LLM processing
-    
-    Args:
-        patent_data: Patent dictionary
-        
-    Returns:
-        Formatted string representation
-    """
+def _build_patent_for_llm(patent_data: Dict) -> str:
+    """Build the LLM text for one patent (see format_patent_for_llm)"""
     formatted = f"""
 PATENT DATA:
 - Title: {patent_data.get('title', 'N/A')}
@@ -207,3 +226,20 @@ PATENT DATA:
 - Abstract: {patent_data.get('abstract', 'N/A')}
 """
     return formatted
+
+
+# LLM text of every database row, built once at import
+_format_patent = precomputed_formatter(PATENTS_DB, _build_patent_for_llm)
+
+
+def format_patent_for_llm(patent_data: Dict) -> str:
+    """
+    Format patent data for LLM processing
+    
+    Args:
+        patent_data: Patent dictionary
+        
+    Returns:
+        Formatted string representation (precomputed for database rows)
+    """
+    return _format_patent(patent_data)
@@ -0,0 +1,57 @@
+"""
+Data Prefetch Tool
+Runs the data-tool lookups for all planned agents once, concurrently, before the agents are invoked
+"""
+import asyncio
+from typing import Dict, Iterable
+
+from tools.clinical_trials_data import get_clinical_trial_data, format_trial_for_llm
+from tools.patent_data import get_patent_data, format_patent_for_llm
+from tools.regulatory_data import get_regulatory_data, format_regulatory_for_llm
+from tools.scientific_journal_data import get_journal_data, format_article_for_llm
+
+
+# agent key -> (lookup function, result list key, per-item formatter). The
+# lookups are the uncopied .shared ones: results are only read here, and the
+# formatters serve precomputed text for database rows by identity
+DATA_SOURCES = {
+    "clinical_trials": (get_clinical_trial_data.shared, "trials", format_trial_for_llm),
+    "patent": (get_patent_data.shared, "patents", format_patent_for_llm),
+    "regulatory": (get_regulatory_data.shared, "applications", format_regulatory_for_llm),
+    "scientific_journal": (get_journal_data.shared, "articles", format_article_for_llm),
+}
+
+
+def fetch_formatted(agent_key: str, query: str) -> str:
+    """
+    Look up one agent's data for a query and format it for the LLM
+
+    Args:
+        agent_key: Agent whose data source to query (a DATA_SOURCES key)
+        query: The user's query
+
+    Returns:
+        Formatted records joined by newlines, or "" if nothing matched
+    """
+    get_data, list_key, format_item = DATA_SOURCES[agent_key]
+    data = get_data(query)
+    items = data.get(list_key, []) if data.get("found") else []
+    return "\n".join(format_item(item) for item in items) + "\n" if items else ""
+
+
+async def data_prefetch_node(query: str, agent_keys: Iterable[str]) -> Dict[str, str]:
+    """
+    Fetch and format the data for every planned agent concurrently
+
+    Args:
+        query: The user's query
+        agent_keys: Planned agents; keys without a data source are skipped
+
+    Returns:
+        Dictionary mapping agent key to its formatted data context
+    """
+    keys = [key for key in agent_keys if key in DATA_SOURCES]
+    bodies = await asyncio.gather(
+        *(asyncio.to_thread(fetch_formatted, key, query) for key in keys)
+    )
+    return dict(zip(keys, bodies))
@@ -3,8 +3,11 @@ Regulatory Data Tool
 Retrieves FDA approval and regulatory data from dummy database
 """
 import json
+from functools import lru_cache
 from typing import Optional, List, Dict
 
+from tools import copied_results, matching_keys, precomputed_formatter, search_blob
+
 
 # Dummy Regulatory Database
 REGULATORY_DB = {
@@ -86,7 +89,34 @@ REGULATORY_DB = {
     }
 }
 
+# Lowercased searchable text per application, built once: the database
+# is static, so searches compare against these instead of rebuilding
+# str(app_data).lower() for every row on every call. Drug name,
+# manufacturer and the whole row form one blob per application (see
+# tools.search_blob)
+_REGULATORY_SEARCH_TEXT = {
+    app_num: search_blob((
+        app_data.get("drug_name", ""),
+        app_data.get("manufacturer", ""),
+        str(app_data),
+    )).lower()
+    for app_num, app_data in REGULATORY_DB.items()
+}
+
+# Static partitions of the database, built once
+_APPROVED_APPLICATIONS = tuple(
+    app_data for app_data in REGULATORY_DB.values() if app_data.get("status") == "Approved"
+)
+_BLACK_BOX_APPLICATIONS = tuple(
+    app_data for app_data in REGULATORY_DB.values() if app_data.get("black_box_warning", False)
+)
+_REMS_APPLICATIONS = tuple(
+    app_data for app_data in REGULATORY_DB.values() if app_data.get("rems_required", False)
+)
 
+
+@copied_results
+@lru_cache(maxsize=512)
 def get_regulatory_data(query: str) -> Dict:
     """
     Retrieves regulatory data from dummy database
@@ -95,7 +125,7 @@ def get_regulatory_data(query: str) -> Dict:
         query: Search query (drug name, application number, or manufacturer)
         
     Returns:
-        Dictionary with matching regulatory data
+        Dictionary with matching regulatory data (memoized per query; each call returns a copy)
     """
     query_lower = query.lower()
     results = {}
@@ -108,11 +138,8 @@ def get_regulatory_data(query: str) -> Dict:
             return {"found": False, "message": f"Application {query} not found"}
     
     # Search by drug name or manufacturer
-    for app_num, app_data in REGULATORY_DB.items():
-        if (query_lower in app_data.get("drug_name", "").lower() or
-            query_lower in app_data.get("manufacturer", "").lower() or
-            query_lower in str(app_data).lower()):
-            results[app_num] = app_data
+    for app_num in matching_keys(query_lower, _REGULATORY_SEARCH_TEXT):
+        results[app_num] = REGULATORY_DB[app_num]
     
     if results:
         return {"found": True, "applications": list(results.values()), "count": len(results)}
@@ -120,73 +147,53 @@ def get_regulatory_data(query: str) -> Dict:
         return {"found": False, "message": f"No regulatory data found for '{query}'"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_approved_drugs() -> Dict:
     """
     Get all FDA approved drugs from database
     
     Returns:
-        Dictionary with approved applications
+        Dictionary with approved applications (memoized; each call returns a copy)
     """
-    results = {}
-    
-    for app_num, app_data in REGULATORY_DB.items():
-        if app_data.get("status") == "Approved":
-            results[app_num] = app_data
-    
-    if results:
-        return {"found": True, "applications": list(results.values()), "count": len(results)}
+    if _APPROVED_APPLICATIONS:
+        return {"found": True, "applications": list(_APPROVED_APPLICATIONS), "count": len(_APPROVED_APPLICATIONS)}
     else:
         return {"found": False, "message": "No approved drugs found"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_drugs_with_black_box_warning() -> Dict:
     """
     Get drugs with black box warnings
     
     Returns:
-        Dictionary with drugs having black box warnings
+        Dictionary with drugs having black box warnings (memoized; each call returns a copy)
     """
-    results = {}
-    
-    for app_num, app_data in REGULATORY_DB.items():
-        if app_data.get("black_box_warning", False):
-            results[app_num] = app_data
-    
-    if results:
-        return {"found": True, "applications": list(results.values()), "count": len(results)}
+    if _BLACK_BOX_APPLICATIONS:
+        return {"found": True, "applications": list(_BLACK_BOX_APPLICATIONS), "count": len(_BLACK_BOX_APPLICATIONS)}
     else:
         return {"found": False, "message": "No drugs with black box warnings found"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_drugs_requiring_rems() -> Dict:
     """
     Get drugs requiring REMS program
     
     Returns:
-        Dictionary with drugs requiring REMS
+        Dictionary with drugs requiring REMS (memoized; each call returns a copy)
     """
-    results = {}
-    
-    for app_num, app_data in REGULATORY_DB.items():
-        if app_data.get("rems_required", False):
-            results[app_num] = app_data
-    
-    if results:
-        return {"found": True, "applications": list(results.values()), "count": len(results)}
+    if _REMS_APPLICATIONS:
+        return {"found": True, "applications": list(_REMS_APPLICATIONS), "count": len(_REMS_APPLICATIONS)}
     else:
         return {"found": False, "message": "No drugs requiring REMS found"}
 
 
-def format_regulatory_for_llm(app_data: Dict) -> str:
-    """
-    Format regulatory data for LLM processing
-    
-    Args:
-        app_data: Regulatory application dictionary
-        
-    Returns:
-        Formatted string representation
-    """
+def _build_regulatory_for_llm(app_data: Dict) -> str:
+    """Build the LLM text for one application (see format_regulatory_for_llm)"""
     app_type = app_data.get("application_type", "N/A")
     
     formatted = f"""
@@ -223,3 +230,20 @@ REGULATORY APPLICATION DATA:
 """
     
     return formatted
+
+
+# LLM text of every database row, built once at import
+_format_application = precomputed_formatter(REGULATORY_DB, _build_regulatory_for_llm)
+
+
+def format_regulatory_for_llm(app_data: Dict) -> str:
+    """
+    Format regulatory data for LLM processing
+    
+    Args:
+        app_data: Regulatory application dictionary
+        
+    Returns:
+        Formatted string representation (precomputed for database rows)
+    """
+    return _format_application(app_data)
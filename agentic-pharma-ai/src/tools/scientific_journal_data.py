@@ -3,8 +3,12 @@ Scientific Journal Data Tool
 Retrieves published research and literature from dummy database
 """
 import json
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional, List, Dict
 
+from tools import copied_results, matching_keys, precomputed_formatter, search_blob
+
 
 # Dummy Scientific Journal Database
 JOURNAL_DB = {
@@ -100,7 +104,38 @@ JOURNAL_DB = {
     }
 }
 
+# Lowercased searchable fields per article, built once: the database is
+# static, so searches compare against these instead of lowering every
+# field on every call. Authors and keywords are joined like the fields of
+# a search blob, so a match lies within a single entry
+_ARTICLE_SEARCH_FIELDS = {
+    doi: (
+        article.get("title", "").lower(),
+        article.get("journal", "").lower(),
+        search_blob(article.get("authors", [])).lower(),
+        search_blob(article.get("keywords", [])).lower(),
+        article.get("study_design", "").lower(),
+    )
+    for doi, article in JOURNAL_DB.items()
+}
+
+# Title, journal, authors and keywords as one blob per article, so a
+# free-text search is one substring check per article
+_ARTICLE_SEARCH_TEXT = {
+    doi: search_blob(fields[:4]) for doi, fields in _ARTICLE_SEARCH_FIELDS.items()
+}
+
+# Articles ordered by citations, most cited first (ties keep database
+# order), with the negated counts alongside in ascending order so a
+# citation threshold is one bisection
+_ARTICLES_BY_CITATIONS = tuple(sorted(
+    JOURNAL_DB.values(), key=lambda article: -article.get("citations", 0)
+))
+_NEG_CITATIONS_SORTED = tuple(-article.get("citations", 0) for article in _ARTICLES_BY_CITATIONS)
+
 
+@copied_results
+@lru_cache(maxsize=512)
 def get_journal_data(query: str) -> Dict:
     """
     Retrieves scientific journal data from dummy database
@@ -109,7 +144,7 @@ def get_journal_data(query: str) -> Dict:
         query: Search query (DOI, title, author, or keyword)
         
     Returns:
-        Dictionary with matching journal articles
+        Dictionary with matching journal articles (memoized per query; each call returns a copy)
     """
     query_lower = query.lower()
     results = {}
@@ -122,12 +157,8 @@ def get_journal_data(query: str) -> Dict:
             return {"found": False, "message": f"DOI {query} not found"}
     
     # Search by title, author, journal, or keywords
-    for doi, article in JOURNAL_DB.items():
-        if (query_lower in article.get("title", "").lower() or
-            query_lower in article.get("journal", "").lower() or
-            any(query_lower in author.lower() for author in article.get("authors", [])) or
-            any(query_lower in keyword.lower() for keyword in article.get("keywords", []))):
-            results[doi] = article
+    for doi in matching_keys(query_lower, _ARTICLE_SEARCH_TEXT):
+        results[doi] = JOURNAL_DB[doi]
     
     if results:
         return {"found": True, "articles": list(results.values()), "count": len(results)}
@@ -135,12 +166,14 @@ def get_journal_data(query: str) -> Dict:
         return {"found": False, "message": f"No articles found for '{query}'"}
 
 
+@copied_results
+@lru_cache(maxsize=1)
 def get_all_articles() -> Dict:
     """
     Retrieves all journal articles from dummy database
     
     Returns:
-        Dictionary with all articles
+        Dictionary with all articles (memoized; each call returns a copy)
     """
     return {
         "found": True,
@@ -149,6 +182,8 @@ def get_all_articles() -> Dict:
     }
 
 
+@copied_results
+@lru_cache(maxsize=64)
 def get_highly_cited_articles(min_citations: int = 100) -> Dict:
     """
     Get articles with high citation counts
@@ -157,20 +192,20 @@ def get_highly_cited_articles(min_citations: int = 100) -> Dict:
         min_citations: Minimum number of citations
         
     Returns:
-        Dictionary with highly cited articles
+        Dictionary with highly cited articles, most cited first (memoized per
+        threshold; each call returns a copy)
     """
-    results = {}
-    
-    for doi, article in JOURNAL_DB.items():
-        if article.get("citations", 0) >= min_citations:
-            results[doi] = article
+    # Articles with citations >= min_citations
+    articles = list(_ARTICLES_BY_CITATIONS[:bisect_right(_NEG_CITATIONS_SORTED, -min_citations)])
     
-    if results:
-        return {"found": True, "articles": list(results.values()), "count": len(results)}
+    if articles:
+        return {"found": True, "articles": articles, "count": len(articles)}
     else:
         return {"found": False, "message": f"No articles with {min_citations}+ citations found"}
 
 
+@copied_results
+@lru_cache(maxsize=512)
 def get_articles_by_journal(journal_name: str) -> Dict:
     """
     Get articles from specific journal
@@ -179,14 +214,14 @@ def get_articles_by_journal(journal_name: str) -> Dict:
         journal_name: Name of the journal
         
     Returns:
-        Dictionary with articles from journal
+        Dictionary with articles from journal (memoized per journal name; each call returns a copy)
     """
     journal_lower = journal_name.lower()
     results = {}
     
-    for doi, article in JOURNAL_DB.items():
-        if journal_lower in article.get("journal", "").lower():
-            results[doi] = article
+    for doi, (_, journal, _, _, _) in _ARTICLE_SEARCH_FIELDS.items():
+        if journal_lower in journal:
+            results[doi] = JOURNAL_DB[doi]
     
     if results:
         return {"found": True, "articles": list(results.values()), "count": len(results)}
@@ -194,6 +229,8 @@ def get_articles_by_journal(journal_name: str) -> Dict:
         return {"found": False, "message": f"No articles found from {journal_name}"}
 
 
+@copied_results
+@lru_cache(maxsize=512)
 def get_articles_by_study_design(study_design: str) -> Dict:
     """
     Get articles by study design
@@ -202,14 +239,14 @@ def get_articles_by_study_design(study_design: str) -> Dict:
         study_design: Type of study (RCT, observational, etc.)
         
     Returns:
-        Dictionary with articles of specified design
+        Dictionary with articles of specified design (memoized per study design; each call returns a copy)
     """
     design_lower = study_design.lower()
     results = {}
     
-    for doi, article in JOURNAL_DB.items():
-        if design_lower in article.get("study_design", "").lower():
-            results[doi] = article
+    for doi, (_, _, _, _, design) in _ARTICLE_SEARCH_FIELDS.items():
+        if design_lower in design:
+            results[doi] = JOURNAL_DB[doi]
     
     if results:
         return {"found": True, "articles": list(results.values()), "count": len(results)}
@@ -217,16 +254,8 @@ def get_articles_by_study_design(study_design: str) -> Dict:
         return {"found": False, "message": f"No {study_design} studies found"}
 
 
-def format_article_for_llm(article: Dict) -> str:
-    """
-    Format journal article for LLM processing
-    
-    Args:
-        article: Article dictionary
-        
-    Returns:
-        Formatted string representation
-    """
+def _build_article_for_llm(article: Dict) -> str:
+    """Build the LLM text for one article (see format_article_for_llm)"""
     formatted = f"""
 JOURNAL ARTICLE DATA:
 - Title: {article.get('title', 'N/A')}
@@ -245,3 +274,20 @@ JOURNAL ARTICLE DATA:
 - Keywords: {', '.join(article.get('keywords', []))}
 """
     return formatted
+
+
+# LLM text of every database row, built once at import
+_format_article = precomputed_formatter(JOURNAL_DB, _build_article_for_llm)
+
+
+def format_article_for_llm(article: Dict) -> str:
+    """
+    Format journal article for LLM processing
+    
+    Args:
+        article: Article dictionary
+        
+    Returns:
+        Formatted string representation (precomputed for database rows)
+    """
+    return _format_article(article)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Checks that the data tools' getters hand out copies, not their cached
+results or the database rows.
+Run directly: python test_data_tools.py (or collect with pytest)
+"""
+
+import sys
+import os
+
+# Set up path so `src` modules import correctly
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if os.path.isdir(src_dir):
+    sys.path.insert(0, src_dir)
+
+from tools import clinical_trials_data, patent_data, regulatory_data, scientific_journal_data
+from tools.prefetch import fetch_formatted
+
+# (getter, args, result list key)
+GETTERS = (
+    (clinical_trials_data.get_clinical_trial_data, ("Phase",), "trials"),
+    (clinical_trials_data.get_all_clinical_trials, (), "trials"),
+    (clinical_trials_data.get_trial_by_phase, ("Phase 3",), "trials"),
+    (patent_data.get_patent_data, ("pharma",), "patents"),
+    (patent_data.get_all_patents, (), "patents"),
+    (patent_data.get_active_patents, (), "patents"),
+    (patent_data.get_patents_expiring_soon, (20,), "patents"),
+    (regulatory_data.get_regulatory_data, ("approved",), "applications"),
+    (regulatory_data.get_approved_drugs, (), "applications"),
+    (scientific_journal_data.get_journal_data, ("cancer",), "articles"),
+    (scientific_journal_data.get_all_articles, (), "articles"),
+    (scientific_journal_data.get_highly_cited_articles, (0,), "articles"),
+)
+
+
+def test_getters_return_independent_copies():
+    """Mutating a result changes neither the next call's result nor the database"""
+    for get, args, list_key in GETTERS:
+        first = get(*args)
+        assert first == get.shared(*args), get.__name__
+        assert first.get(list_key), get.__name__
+        first["mutated"] = True
+        first[list_key][0]["mutated"] = True
+        first[list_key].clear()
+        second = get(*args)
+        assert "mutated" not in second, get.__name__
+        assert second[list_key] and "mutated" not in second[list_key][0], get.__name__
+        assert second == get.shared(*args), get.__name__
+
+
+def test_prefetch_serves_precomputed_text():
+    """fetch_formatted reads the shared rows, so the formatters hit their precomputed text"""
+    trial = clinical_trials_data.CLINICAL_TRIALS_DB["NCT04567890"]
+    assert clinical_trials_data.get_clinical_trial_data.shared("NCT04567890")["trials"][0] is trial
+    assert fetch_formatted("clinical_trials", "NCT04567890") == (
+        clinical_trials_data.format_trial_for_llm(trial) + "\n"
+    )
+
+
+if __name__ == "__main__":
+    for test in (
+        test_getters_return_independent_copies,
+        test_prefetch_serves_precomputed_text,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
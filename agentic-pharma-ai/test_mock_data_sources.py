@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Shape and determinism checks for the MockDataSources search_* mocks.
+Run directly: python test_mock_data_sources.py (or collect with pytest)
+
+test_mock_data_sources_shapes.json records the key structure and value
+types each search_* method returned before its generation was vectorized
+and memoized; a list is recorded as its distinct element shapes.
+"""
+
+import sys
+import json
+import random
+import os
+
+import numpy as np
+import orjson
+
+# Set up path so `src` modules import correctly
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if os.path.isdir(src_dir):
+    sys.path.insert(0, src_dir)
+
+import database
+from database import MockDataSources
+
+SEARCH_METHODS = (
+    "search_iqvia",
+    "search_exim",
+    "search_patents",
+    "search_clinical_trials",
+    "search_internal_docs",
+    "web_search",
+)
+QUERIES = ("Metformin", "Losartan", "Unknown Molecule")
+
+with open(os.path.join(script_dir, "test_mock_data_sources_shapes.json")) as f:
+    EXPECTED_SHAPES = json.load(f)
+
+
+def shape(value):
+    """Key structure and leaf type names of a JSON-shaped result"""
+    if isinstance(value, dict):
+        return {key: shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        shapes = []
+        for item in value:
+            item_shape = shape(item)
+            if item_shape not in shapes:
+                shapes.append(item_shape)
+        return shapes
+    return type(value).__name__
+
+
+def seed(n: int) -> None:
+    """Seed both generators the mocks draw from"""
+    random.seed(n)
+    database._RNG = np.random.default_rng(n)
+
+
+def test_search_shapes_match_original():
+    """Every search_* result keeps the original keys, key order and value types"""
+    for name in SEARCH_METHODS:
+        for query in QUERIES:
+            result = getattr(MockDataSources, name)(query)
+            # json.dumps compares key order as well as keys
+            assert json.dumps(shape(result)) == json.dumps(EXPECTED_SHAPES[name]), (name, query)
+    for query in QUERIES:
+        result = MockDataSources.search_iqvia_fast(query).to_dict()
+        assert json.dumps(shape(result)) == json.dumps(EXPECTED_SHAPES["search_iqvia"]), query
+
+
+def test_search_deterministic_under_seed():
+    """With both generators seeded, an uncached search_* call repeats exactly"""
+    for name in SEARCH_METHODS:
+        generate = getattr(MockDataSources, name).__wrapped__
+        for query in QUERIES:
+            seed(7)
+            first = generate(query)
+            seed(7)
+            assert generate(query) == first, (name, query)
+
+
+def test_search_memoized_per_key():
+    """Repeat calls return equal, independent copies; *_json is the cached bytes"""
+    MockDataSources.clear_cache()
+    for name in SEARCH_METHODS:
+        search = getattr(MockDataSources, name)
+        search_json = getattr(MockDataSources, f"{name}_json")
+        for query in QUERIES:
+            first = search(query)
+            first["mutated"] = True
+            second = search(query)
+            assert "mutated" not in second, (name, query)
+            del first["mutated"]
+            assert second == first, (name, query)
+            assert orjson.loads(search_json(query)) == second, (name, query)
+
+
+if __name__ == "__main__":
+    for test in (
+        test_search_shapes_match_original,
+        test_search_deterministic_under_seed,
+        test_search_memoized_per_key,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
@@ -129,9 +129,7 @@ def test_orchestrator():
         print("[TEST 4] Query Router")
         print("-" * 80)
         
-        from src.graph.router import route_query
-        from src.graph.state import State
-        from langchain_core.messages import HumanMessage
+        from src.graph.router import route_queries
         
         test_queries = [
             "What clinical trials are recruiting?",
@@ -140,20 +138,14 @@ def test_orchestrator():
             "Recent cancer research papers"
         ]
         
-        for test_query in test_queries:
-            state = State(
-                system_prompt="",
-                clinical_trials_prompt="",
-                patent_prompt="",
-                regulator_prompt="",
-                scientific_journal_prompt="",
-                message=[HumanMessage(content=test_query)]
-            )
-            try:
-                result = route_query(state)
+        # One call routes every query; any the keyword router cannot decide
+        # share a single batched LLM request
+        try:
+            results = route_queries(test_queries)
+            for test_query, result in zip(test_queries, results):
                 print(f"✓ '{test_query[:40]}...' → {result}")
-            except Exception as e:
-                print(f"✗ Routing error for '{test_query[:40]}...': {e}")
+        except Exception as e:
+            print(f"✗ Routing error: {e}")
         
         print("\n")
         print("=" * 80)
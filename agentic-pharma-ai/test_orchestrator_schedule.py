@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Checks for the orchestrator's scheduling and final answer when agents fail.
+Run directly: python test_orchestrator_schedule.py (or collect with pytest)
+
+Agents are replaced by a stub `run_agent`, so no LLM is called.
+"""
+
+import sys
+import asyncio
+import os
+
+# Set up path so `src` modules import correctly
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if os.path.isdir(src_dir):
+    sys.path.insert(0, src_dir)
+
+from langchain_core.messages import AIMessage
+
+from graph.scheduler import schedule
+from orchestrator import _agent_failure, format_response, initialize_state
+
+
+def stub_agents(answers: dict):
+    """run_agent for `schedule`: an AIMessage per answer, a failure for None"""
+    async def run_agent(key, state):
+        if answers.get(key) is None:
+            return _agent_failure(key, RuntimeError("boom"))
+        return AIMessage(content=answers[key])
+    return run_agent
+
+
+def run(agent_keys, answers: dict) -> dict:
+    state = initialize_state("clinical trials and patents for IMT-50")
+    return asyncio.run(schedule(state, agent_keys, stub_agents(answers)))
+
+
+def test_one_of_two_agents_failed():
+    """The successful answer is returned, not the failed agent's error"""
+    final_state = run(["clinical_trials", "patent"], {"clinical_trials": "Trial answer"})
+    assert final_state["synthesized"] is False
+    assert format_response(final_state) == "Trial answer"
+
+
+def test_summarizer_failed():
+    """A failed synthesis falls back to the specialist answers"""
+    final_state = run(
+        ["clinical_trials", "patent"],
+        {"clinical_trials": "Trial answer", "patent": "Patent answer"},
+    )
+    assert final_state["synthesized"] is False
+    assert format_response(final_state) == "Trial answer\n\nPatent answer"
+
+
+def test_synthesis_is_the_answer():
+    final_state = run(
+        ["clinical_trials", "patent"],
+        {"clinical_trials": "Trial answer", "patent": "Patent answer", "summarizer": "Summary"},
+    )
+    assert final_state["synthesized"] is True
+    assert format_response(final_state) == "Summary"
+
+
+if __name__ == "__main__":
+    for test in (
+        test_one_of_two_agents_failed,
+        test_summarizer_failed,
+        test_synthesis_is_the_answer,
+    ):
+        test()
+        print(f"✓ {test.__name__}")